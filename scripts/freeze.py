@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Freeze the SER model to a SavedModel with a single inference signature.
+Pass the output directory to the CLI with -m to skip rebuilding the Keras
+layers on every load.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ser.config import get_model_path
+from ser.model import freeze_model, load_model_with_fallback
+
+def freeze(model_path, output_dir=None):
+    """Export a Keras model as a frozen SavedModel directory."""
+    model_path = Path(model_path) if model_path else get_model_path()
+    output_dir = Path(output_dir) if output_dir else model_path.with_suffix("")
+    
+    # Export from the float32 graph, even on GPU hosts
+    model = load_model_with_fallback(model_path, use_tflite=False, mixed_precision=False)
+    freeze_model(model, output_dir)
+    
+    print(f"✅ SavedModel written: {output_dir}")
+    return output_dir
+
+def main():
+    parser = argparse.ArgumentParser(description="Freeze the SER model to a SavedModel")
+    parser.add_argument("-m", "--model", type=Path, help="Path to Keras model (default: auto-detect)")
+    parser.add_argument("-o", "--output", type=Path, help="Output directory (default: model path without suffix)")
+    args = parser.parse_args()
+    
+    try:
+        freeze(args.model, args.output)
+    except Exception as e:
+        print(f"❌ Error freezing model: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
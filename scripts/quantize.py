@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Quantize the SER model to full-integer int8 TFLite.
+Writes <model>.tflite next to the Keras model; load_model_with_fallback
+picks it up automatically.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ser.config import EXAMPLES_DIR, get_model_path
+from ser.features import extract_features, load_features
+from ser.model import convert_to_tflite_int8, load_model_with_fallback
+
+def load_calibration_features(num_samples=100):
+    """Collect real MFCC vectors to calibrate activation ranges."""
+    try:
+        X, _ = load_features()
+        if len(X) > num_samples:
+            rng = np.random.default_rng(0)
+            X = X[rng.choice(len(X), num_samples, replace=False)]
+        return np.asarray(X, dtype=np.float32)
+    except FileNotFoundError:
+        print("⚠️  No dataset features found, calibrating on example files")
+    
+    features = [extract_features(p) for p in sorted(EXAMPLES_DIR.glob("*.wav"))]
+    if not features:
+        raise FileNotFoundError(f"No calibration audio found in {EXAMPLES_DIR}")
+    return np.stack(features).astype(np.float32)
+
+def quantize_model(model_path, output_path=None, num_samples=100):
+    """Convert a Keras model to an int8 TFLite flatbuffer."""
+    model_path = Path(model_path) if model_path else get_model_path()
+    output_path = Path(output_path) if output_path else model_path.with_suffix(".tflite")
+    
+    # Export from the float32 graph, even on GPU hosts
+    model = load_model_with_fallback(model_path, use_tflite=False, mixed_precision=False)
+    calibration = load_calibration_features(num_samples)
+    print(f"🔍 Calibrating on {len(calibration)} feature vectors")
+    
+    output_path.write_bytes(convert_to_tflite_int8(model, calibration))
+    
+    size_kb = output_path.stat().st_size / 1024
+    print(f"✅ Quantized model saved: {output_path} ({size_kb:.1f} KB)")
+    return output_path
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize the SER model to int8 TFLite")
+    parser.add_argument("-m", "--model", type=Path, help="Path to Keras model (default: auto-detect)")
+    parser.add_argument("-o", "--output", type=Path, help="Output .tflite path (default: next to model)")
+    parser.add_argument("-n", "--num-samples", type=int, default=100, help="Calibration samples")
+    args = parser.parse_args()
+    
+    try:
+        quantize_model(args.model, args.output, args.num_samples)
+    except Exception as e:
+        print(f"❌ Error quantizing model: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
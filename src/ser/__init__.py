@@ -16,9 +16,16 @@ from .inference import *
 __all__ = [
     "EMOTIONS",
     "extract_features", 
+    "extract_features_batch",
+    "get_cached_model",
+    "load_audio",
+    "load_model_fast",
     "load_model_with_fallback",
     "predict_emotion",
+    "predict_emotion_batch",
+    "predict_features",
     "predict_path",
+    "predict_paths",
     "BASE_DIR",
     "MODEL_PATH",
     "EXAMPLES_DIR"
@@ -5,10 +5,14 @@ Provides an interactive interface for testing the SER model with futuristic ente
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
-import tempfile
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 import logging
+import io
+import hashlib
+import os
 import base64
 
 import streamlit as st
@@ -16,15 +20,16 @@ import numpy as np
 import pandas as pd
 import altair as alt
 import librosa
-import matplotlib.pyplot as plt
 
 # Handle both package and direct execution
 try:
-    from .model import predict_path, load_model_with_fallback
+    from .model import predict_features, load_model_with_fallback
+    from .features import extract_features, load_audio
     from .config import EXAMPLES_DIR, get_model_path
 except ImportError:
     # Fallback for direct execution
-    from model import predict_path, load_model_with_fallback
+    from model import predict_features, load_model_with_fallback
+    from features import extract_features, load_audio
     from config import EXAMPLES_DIR, get_model_path
 
 # Set up logging
@@ -55,13 +60,37 @@ EMOTION_COLORS = {
     "surprised": "#FFD700",
 }
 
+# Static assets (CSS, logo), as an absolute path so it's a stable cache key
+ASSETS_PATH = Path(__file__).resolve().parent / "assets"
+
+# Sample rate for waveform/spectrogram display
+PLOT_SR = 8000
+
+# Display budgets: points in the waveform line, time columns in the mel heatmap
+WAVE_POINTS = 2000
+MEL_FRAMES = 256
+
+@st.cache_data(show_spinner=False)
+def _read_css(path: str) -> Optional[str]:
+    """Read a stylesheet once; None if it doesn't exist."""
+    css_file = Path(path)
+    return css_file.read_text() if css_file.exists() else None
+
+@st.cache_data(show_spinner=False)
+def _logo_data_uri(path: str) -> Optional[str]:
+    """Read and base64-encode the SVG logo once; None if it doesn't exist."""
+    logo_file = Path(path)
+    if not logo_file.exists():
+        return None
+    svg_base64 = base64.b64encode(logo_file.read_bytes()).decode()
+    return f"data:image/svg+xml;base64,{svg_base64}"
+
 def load_css():
     """Load custom CSS for futuristic enterprise dashboard theme."""
-    css_file = Path(__file__).parent / "assets" / "style.css"
+    css = _read_css(str(ASSETS_PATH / "style.css"))
     
-    if css_file.exists():
-        with open(css_file, 'r') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+    if css is not None:
+        st.markdown(f'<style>{css}</style>', unsafe_allow_html=True)
     else:
         # Fallback CSS if file doesn't exist
         st.markdown("""
@@ -77,71 +106,182 @@ def load_css():
 
 def get_logo_svg():
     """Get the custom logo SVG as base64 for embedding."""
-    logo_file = Path(__file__).parent / "assets" / "logo.svg"
-    
-    if logo_file.exists():
-        with open(logo_file, 'r') as f:
-            svg_content = f.read()
-            # Convert SVG to base64 for embedding
-            svg_base64 = base64.b64encode(svg_content.encode()).decode()
-            return f"data:image/svg+xml;base64,{svg_base64}"
+    logo_uri = _logo_data_uri(str(ASSETS_PATH / "logo.svg"))
     
     # Fallback to emoji if logo not found
-    return "🎙️"
+    return logo_uri if logo_uri is not None else "🎙️"
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def get_model():
-    """Load and cache the model."""
+    """
+    Load and cache the model.
+    
+    Runs at import, before st.set_page_config, so it must not issue any
+    Streamlit command (spinner or st.error); failures are logged and
+    reported by main() instead.
+    """
     try:
         model_path = get_model_path()
-        return load_model_with_fallback(model_path)
+        return load_model_with_fallback(model_path), None
     except Exception as e:
-        st.error(f"Failed to load model: {e}")
-        return None
+        logger.error(f"Failed to load model: {e}")
+        return None, str(e)
+
+# Load the model eagerly, once per worker process, so new sessions don't pay
+# the cold start on their first rerun
+if "_MODEL" not in globals():
+    _MODEL, _MODEL_ERROR = get_model()
+
+@st.cache_data(show_spinner=False)
+def _cached_features(path_str: str, mtime: float) -> np.ndarray:
+    """Extract and cache MFCC features; mtime keeps the cache key fresh if the file changes."""
+    return extract_features(Path(path_str))
+
+@st.cache_resource(show_spinner=False)
+def _precompute_example_feats() -> Dict[str, np.ndarray]:
+    """
+    Extract features for every example file once, in parallel.
+    
+    Threads rather than processes: forking the server after TensorFlow has
+    started its thread pools can deadlock, and decoding, the FFT and the
+    mel kernel all release the GIL.
+    """
+    example_files = sorted(EXAMPLES_DIR.glob("*.wav"))
+    if not example_files:
+        return {}
+    
+    try:
+        workers = min(len(example_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            features = list(executor.map(extract_features, example_files))
+        return dict(zip((p.name for p in example_files), features))
+    except Exception as e:
+        # Fall back to extracting each example on demand
+        logger.error(f"Error precomputing example features: {e}")
+        return {}
 
-def show_wave_and_melspec(audio_path: Path) -> None:
-    """Display waveform and mel spectrogram visualizations."""
+def upload_buffer(uploaded_file) -> io.BytesIO:
+    """Wrap an uploaded file's bytes in a named in-memory buffer for decoding."""
+    buf = io.BytesIO(uploaded_file.getvalue())
+    buf.name = uploaded_file.name
+    return buf
+
+@st.cache_data(show_spinner=False)
+def _cached_upload_features(data: bytes) -> np.ndarray:
+    """Extract and cache MFCC features for uploaded audio, keyed on its bytes."""
+    return extract_features(io.BytesIO(data))
+
+def get_features(audio: Union[Path, io.BytesIO]) -> np.ndarray:
+    """Get MFCC features for an audio file or upload buffer, reusing cached results across reruns."""
+    if isinstance(audio, Path):
+        return _cached_features(str(audio), audio.stat().st_mtime)
+    return _cached_upload_features(audio.getvalue())
+
+@lru_cache(maxsize=None)
+def _plot_mel_fb(sr: int) -> np.ndarray:
+    """Mel filterbank for the spectrogram plot, built once per sample rate."""
+    return librosa.filters.mel(sr=sr, n_fft=1024, n_mels=64).astype(np.float32)
+
+@st.cache_data(show_spinner=False)
+def _audio_viz_arrays(file_bytes: bytes) -> Tuple[np.ndarray, int, np.ndarray]:
+    """Decode audio and compute the dB-scaled mel spectrogram used by the plots, keyed on the file bytes."""
+    # Display-only path: a low sample rate looks identical at screen resolution.
+    # Predictions still use extract_features at the model's sample rate.
+    x, sr = load_audio(io.BytesIO(file_bytes), sr=PLOT_SR, res_type="soxr_qq")
+    S = _plot_mel_fb(sr) @ (np.abs(librosa.stft(x, n_fft=1024, hop_length=256)) ** 2)
+    S_db = librosa.power_to_db(S, ref=np.max)
+    return x, sr, S_db
+
+def downsample_frames(S_db: np.ndarray, n_cols: int = MEL_FRAMES) -> np.ndarray:
+    """Average a (n_mels, T) spectrogram down to at most n_cols time columns."""
+    T = S_db.shape[1]
+    if T <= n_cols:
+        return S_db
+    edges = np.linspace(0, T, n_cols + 1).astype(int)
+    return np.add.reduceat(S_db, edges[:-1], axis=1) / np.diff(edges)
+
+def create_waveform_chart(x: np.ndarray, sr: int) -> alt.Chart:
+    """Create an Altair line chart of the waveform, decimated to WAVE_POINTS."""
+    stride = max(1, len(x) // WAVE_POINTS)
+    df = pd.DataFrame({
+        't': np.arange(0, len(x), stride) / sr,
+        'x': x[::stride]
+    })
+    
+    return alt.Chart(df).mark_line(color='#48CAE4', strokeWidth=1).encode(
+        x=alt.X('t:Q', title='Time (s)', axis=alt.Axis(labelColor='#90E0EF', titleColor='#CAF0F8')),
+        y=alt.Y('x:Q', title='Amplitude', axis=alt.Axis(labelColor='#90E0EF', titleColor='#CAF0F8'))
+    ).properties(
+        height=220
+    ).configure_view(
+        strokeWidth=0
+    )
+
+def create_melspec_chart(S_db: np.ndarray) -> alt.Chart:
+    """Create an Altair heatmap of a dB mel spectrogram, downsampled to MEL_FRAMES columns."""
+    S_ds = downsample_frames(S_db)
+    n_mels, n_frames = S_ds.shape
+    df = pd.DataFrame({
+        'frame': np.tile(np.arange(n_frames), n_mels),
+        'mel': np.repeat(np.arange(n_mels), n_frames),
+        'db': S_ds.ravel()
+    })
+    
+    return alt.Chart(df).mark_rect().encode(
+        x=alt.X('frame:O', title='Frame', axis=None),
+        # Descending so low mel bins sit at the bottom
+        y=alt.Y('mel:O', title='Mel bin', sort='descending', axis=None),
+        color=alt.Color('db:Q', title='dB', scale=alt.Scale(scheme='viridis')),
+        tooltip=[alt.Tooltip('db:Q', format='.1f', title='dB')]
+    ).properties(
+        height=220
+    ).configure_view(
+        strokeWidth=0
+    )
+
+def show_wave_and_melspec(file_bytes: bytes) -> None:
+    """Display waveform and mel spectrogram visualizations for an audio file's bytes."""
     try:
-        x, sr = librosa.load(str(audio_path), res_type="kaiser_fast")
+        x, sr, S_db = _audio_viz_arrays(file_bytes)
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 📊 Waveform")
-            fig, ax = plt.subplots(figsize=(5.5, 2.2))
-            ax.plot(np.linspace(0, len(x)/sr, num=len(x)), x, color="#48CAE4", linewidth=0.8)
-            ax.set_xlabel("Time (s)")
-            ax.set_ylabel("Amplitude")
-            ax.grid(alpha=0.2)
-            ax.set_facecolor('none')
-            fig.patch.set_facecolor('none')
-            st.pyplot(fig, use_container_width=True)
-            plt.close(fig)
+            st.altair_chart(create_waveform_chart(x, sr), use_container_width=True)
             
         with col2:
             st.markdown("#### 🎵 Mel Spectrogram")
-            S = librosa.feature.melspectrogram(y=x, sr=sr, n_mels=64)
-            S_db = librosa.power_to_db(S, ref=np.max)
-            fig, ax = plt.subplots(figsize=(5.5, 2.2))
-            im = ax.imshow(S_db, aspect='auto', origin='lower', cmap='viridis')
-            ax.set_xlabel("Frames")
-            ax.set_ylabel("Mel bins")
-            fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
-            ax.set_facecolor('none')
-            fig.patch.set_facecolor('none')
-            st.pyplot(fig, use_container_width=True)
-            plt.close(fig)
+            st.altair_chart(create_melspec_chart(S_db), use_container_width=True)
             
     except Exception as e:
         st.error(f"Error creating visualizations: {e}")
 
+def file_digest(data: bytes) -> str:
+    """Content hash identifying an audio file across reruns and renames."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_predict(
+    file_hash: str, file_name: str, _model, _get_features: Callable[[], np.ndarray]
+) -> Dict[str, Any]:
+    """
+    Predict once per distinct audio content.
+    
+    Keyed on the content hash (and display name); the underscore-prefixed
+    model and feature callback are not hashed, and the callback only runs
+    on a cache miss.
+    """
+    return predict_features(_model, _get_features(), Path(file_name))
+
 def create_probability_chart(emotions: List[str], probabilities: List[float]) -> alt.Chart:
     """Create an Altair chart for emotion probabilities with Ocean Blue Serenity theme."""
     try:
-        # Create DataFrame for Altair
+        # Create DataFrame for Altair; a float ndarray column skips pandas'
+        # per-element type inference over the Python list
         df = pd.DataFrame({
             'emotion': emotions,
-            'probability': probabilities
+            'probability': np.asarray(probabilities, dtype=float)
         })
         
         # Create the chart with custom colors
@@ -249,10 +389,10 @@ def main() -> None:
     </header>
     """, unsafe_allow_html=True)
     
-    # Load model
-    model = get_model()
+    # Use the model loaded at import
+    model = _MODEL
     if model is None:
-        st.error("❌ Model failed to load. Please check the model file.")
+        st.error(f"❌ Model failed to load. Please check the model file. ({_MODEL_ERROR})")
         return
     
     # Sidebar controls with glassmorphism
@@ -296,6 +436,9 @@ def main() -> None:
             if not example_files:
                 st.info("No example .wav files found in the examples directory.")
             else:
+                # Features for all examples, so Analyze only runs the model
+                example_features = _precompute_example_feats()
+                
                 # File selection
                 file_names = [p.name for p in example_files]
                 selected_name = st.selectbox(
@@ -306,6 +449,8 @@ def main() -> None:
                 
                 if selected_name:
                     selected_file = EXAMPLES_DIR / selected_name
+                    file_bytes = selected_file.read_bytes()
+                    file_hash = file_digest(file_bytes)
                     
                     # Audio player
                     st.markdown('<div class="audio-viz">', unsafe_allow_html=True)
@@ -316,14 +461,18 @@ def main() -> None:
                     # Visualizations
                     st.markdown('<div class="audio-viz">', unsafe_allow_html=True)
                     st.markdown("#### 📊 Audio Analysis")
-                    show_wave_and_melspec(selected_file)
+                    show_wave_and_melspec(file_bytes)
                     st.markdown('</div>', unsafe_allow_html=True)
                     
                     # Prediction button
                     if st.button("🚀 Analyze Audio", type="primary"):
                         with st.spinner("🔍 Analyzing audio with AI..."):
                             try:
-                                result = predict_path(selected_file)
+                                result = _cached_predict(
+                                    file_hash, selected_name, model,
+                                    lambda: example_features[selected_name] if selected_name in example_features
+                                    else get_features(selected_file)
+                                )
                                 display_results(result, selected_file)
                             except Exception as e:
                                 st.error(f"❌ Prediction failed: {e}")
@@ -340,10 +489,9 @@ def main() -> None:
         st.markdown('</div>', unsafe_allow_html=True)
         
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-                tmp_file.write(uploaded_file.getbuffer())
-                temp_path = Path(tmp_file.name)
+            # Decode straight from memory; no temp file needed
+            buf = upload_buffer(uploaded_file)
+            file_hash = file_digest(buf.getvalue())
             
             try:
                 # Audio player
@@ -355,24 +503,20 @@ def main() -> None:
                 # Visualizations
                 st.markdown('<div class="audio-viz">', unsafe_allow_html=True)
                 st.markdown("#### 📊 Audio Analysis")
-                show_wave_and_melspec(temp_path)
+                show_wave_and_melspec(buf.getvalue())
                 st.markdown('</div>', unsafe_allow_html=True)
                 
                 # Prediction button
                 if st.button("🚀 Analyze Audio", type="primary"):
                     with st.spinner("🔍 Analyzing audio with AI..."):
                         try:
-                            result = predict_path(temp_path)
-                            display_results(result, temp_path)
+                            result = _cached_predict(file_hash, uploaded_file.name, model, lambda: get_features(buf))
+                            display_results(result, Path(uploaded_file.name))
                         except Exception as e:
                             st.error(f"❌ Prediction failed: {e}")
-                        finally:
-                            # Clean up temp file
-                            temp_path.unlink(missing_ok=True)
                             
             except Exception as e:
                 st.error(f"❌ Error processing uploaded file: {e}")
-                temp_path.unlink(missing_ok=True)
     
     # Footer
     st.markdown("""
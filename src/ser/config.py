@@ -38,6 +38,9 @@ DATASET_FEATURES_DIR = PROCESSED_DATA_DIR / "dataset_features"
 MODEL_PATH = MODELS_DIR / "SER_model.h5"
 MODEL_PATH_LEGACY = BASE_DIR / "Deep Learning" / "SER_model.h5"
 
+# Audio settings
+TARGET_SR = 22050  # Sample rate the model's MFCC features were trained at
+
 # Emotion labels
 EMOTIONS = [
     "neutral", "calm", "happy", "sad", "angry", "fear", "disgust", "surprised"
@@ -93,8 +96,8 @@ def validate_paths() -> dict:
     
     # Check for required data files
     if DATASET_FEATURES_DIR.exists():
-        status["X_features"] = (DATASET_FEATURES_DIR / "X.joblib").exists()
-        status["y_features"] = (DATASET_FEATURES_DIR / "y.joblib").exists()
+        status["X_features"] = any((DATASET_FEATURES_DIR / name).exists() for name in ("X.npy", "X_q.npy", "X.joblib"))
+        status["y_features"] = any((DATASET_FEATURES_DIR / name).exists() for name in ("y.npy", "y.joblib"))
     
     return status
 
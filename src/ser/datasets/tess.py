@@ -3,12 +3,17 @@ TESS dataset processing utilities.
 Handles the Toronto Emotional Speech Set (TESS) dataset organization and processing.
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import os
 import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 import logging
 
 from ..config import TESS_ORIGINAL_DIR, FEATURES_DIR, ensure_dirs_exist
+from ..features import build_waveform_store
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +30,125 @@ TESS_EMOTION_MAP = {
     "sad": "sad"
 }
 
+# RAVDESS emotion codes used in the generated filenames
+_EMOTION_CODES = {
+    "neutral": 1,
+    "calm": 2,
+    "happy": 3,
+    "sad": 4,
+    "angry": 5,
+    "fear": 6,
+    "disgust": 7,
+    "surprised": 8
+}
+
+# Copies are I/O-bound; enough threads to keep the disk queue busy
+COPY_WORKERS = 16
+
+def _walk_wav(root: Path) -> Iterator[Path]:
+    """Recursively yield .wav files under root, filtering names before building Paths."""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".wav"):
+                yield Path(dirpath) / name
+
+def _copy_fd_range(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy size bytes between descriptors with copy_file_range, else sendfile."""
+    offset = 0
+    use_copy_file_range = hasattr(os, "copy_file_range")
+    while offset < size:
+        if use_copy_file_range:
+            try:
+                sent = os.copy_file_range(src_fd, dst_fd, size - offset)
+            except OSError:
+                # e.g. cross-filesystem copies on older kernels
+                use_copy_file_range = False
+                continue
+        else:
+            # Explicit source offset; the destination position advances on its own
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            raise OSError("Unexpected end of file during copy")
+        offset += sent
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file in-kernel where the platform allows it.
+    
+    Tries copy_file_range (which can reflink on CoW filesystems), then
+    sendfile, then falls back to shutil.copy2. Metadata is copied like
+    copy2 in every case.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            _copy_fd_range(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError):
+        # No in-kernel copy available (e.g. Windows)
+        shutil.copy2(src, dst)
+
+def _target_path(audio_file: Path, actor_25_dir: Path, actor_26_dir: Path) -> Optional[Path]:
+    """
+    Map one TESS file to its RAVDESS-style path in its actor folder.
+    
+    Returns:
+        The target path, or None if the file should be skipped
+    """
+    # Parse filename to extract information
+    # Expected format: YAF_*_emotion.wav
+    filename = audio_file.stem
+    parts = filename.split('_')
+    
+    if len(parts) < 3:
+        logger.warning(f"Skipping file with unexpected format: {filename}")
+        return None
+    
+    # Extract emotion from filename
+    emotion_part = parts[-1].lower()
+    emotion = TESS_EMOTION_MAP.get(emotion_part)
+    
+    if emotion is None:
+        logger.warning(f"Unknown emotion '{emotion_part}' in {filename}")
+        return None
+    
+    # Determine actor (25 or 26) based on file characteristics
+    # This is a simplified approach - you might need to adjust based on actual TESS structure
+    actor_num = 25 if "YAF" in filename else 26
+    
+    # Create new filename in RAVDESS format
+    # Format: modality-vocal_channel-emotion-intensity-statement-repetition-actor.wav
+    new_filename = f"02-01-{get_emotion_code(emotion)}-01-01-01-{actor_num:02d}.wav"
+    
+    # Determine target directory
+    target_dir = actor_25_dir if actor_num == 25 else actor_26_dir
+    return target_dir / new_filename
+
+def _copy_one(audio_file: Path, target_path: Path) -> str:
+    """
+    Copy one TESS file to its target path.
+    
+    Returns:
+        The target actor folder name ("Actor_25" or "Actor_26"), or "skipped"
+    """
+    try:
+        # Write a temp file and rename it into place, so an interrupted run
+        # never leaves a truncated .wav behind
+        tmp_path = target_path.with_name(f".{target_path.name}.{threading.get_ident()}.tmp")
+        try:
+            _fast_copy(audio_file, tmp_path)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            # Don't leave a partial temp file in the actor folder
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        logger.debug(f"Processed {audio_file.name} -> {target_path.name}")
+        return target_path.parent.name
+        
+    except Exception as e:
+        logger.error(f"Error processing {audio_file}: {e}")
+        return "skipped"
+
 def process_tess_dataset(source_dir: Optional[Path] = None) -> None:
     """
     Process the TESS dataset and organize files into Actor_25 and Actor_26 folders.
@@ -51,65 +175,45 @@ def process_tess_dataset(source_dir: Optional[Path] = None) -> None:
     logger.info(f"Processing TESS dataset from {source_dir}")
     
     # Find all audio files
-    audio_files = list(source_dir.rglob("*.wav"))
+    audio_files = list(_walk_wav(source_dir))
     if not audio_files:
         logger.warning(f"No .wav files found in {source_dir}")
         return
     
     logger.info(f"Found {len(audio_files)} audio files")
     
-    processed_count = 0
-    skipped_count = 0
-    
+    # Many sources map to the same RAVDESS-style name; as with copying one
+    # file after another, the last source in walk order wins. Resolving
+    # that up front keeps the result deterministic and copies each target once.
+    targets: Dict[Path, Path] = {}
+    unmapped_count = 0
     for audio_file in audio_files:
-        try:
-            # Parse filename to extract information
-            # Expected format: YAF_*_emotion.wav
-            filename = audio_file.stem
-            parts = filename.split('_')
-            
-            if len(parts) < 3:
-                logger.warning(f"Skipping file with unexpected format: {filename}")
-                skipped_count += 1
-                continue
-            
-            # Extract emotion from filename
-            emotion_part = parts[-1].lower()
-            emotion = TESS_EMOTION_MAP.get(emotion_part)
-            
-            if emotion is None:
-                logger.warning(f"Unknown emotion '{emotion_part}' in {filename}")
-                skipped_count += 1
-                continue
-            
-            # Determine actor (25 or 26) based on file characteristics
-            # This is a simplified approach - you might need to adjust based on actual TESS structure
-            actor_num = 25 if "YAF" in filename else 26
-            
-            # Create new filename in RAVDESS format
-            # Format: modality-vocal_channel-emotion-intensity-statement-repetition-actor.wav
-            new_filename = f"02-01-{get_emotion_code(emotion)}-01-01-01-{actor_num:02d}.wav"
-            
-            # Determine target directory
-            target_dir = actor_25_dir if actor_num == 25 else actor_26_dir
-            target_path = target_dir / new_filename
-            
-            # Copy file
-            shutil.copy2(audio_file, target_path)
-            processed_count += 1
-            
-            logger.debug(f"Processed {audio_file.name} -> {new_filename}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {audio_file}: {e}")
-            skipped_count += 1
-            continue
+        target_path = _target_path(audio_file, actor_25_dir, actor_26_dir)
+        if target_path is None:
+            unmapped_count += 1
+        else:
+            targets[target_path] = audio_file
+    
+    # Copy the unique targets concurrently; each returns its status for the
+    # summary. Targets are unique, so the per-actor totals are files on disk,
+    # counted without re-globbing.
+    with ThreadPoolExecutor(COPY_WORKERS) as executor:
+        status_counts = Counter(executor.map(_copy_one, targets.values(), targets.keys()))
+    per_actor = [status_counts[actor_25_dir.name], status_counts[actor_26_dir.name]]
+    processed_count = sum(per_actor)
+    skipped_count = unmapped_count + status_counts["skipped"]
+    duplicate_count = len(audio_files) - unmapped_count - len(targets)
     
     logger.info(f"TESS processing complete:")
     logger.info(f"  ✅ Processed: {processed_count} files")
     logger.info(f"  ⚠️  Skipped: {skipped_count} files")
-    logger.info(f"  📁 Actor_25: {len(list(actor_25_dir.glob('*.wav')))} files")
-    logger.info(f"  📁 Actor_26: {len(list(actor_26_dir.glob('*.wav')))} files")
+    logger.info(f"  🔁 Superseded: {duplicate_count} files sharing a target name")
+    logger.info(f"  📁 Actor_25: {per_actor[0]} files")
+    logger.info(f"  📁 Actor_26: {per_actor[1]} files")
+    
+    # Pack each actor's files into a waveform store for feature extraction
+    for actor_dir in (actor_25_dir, actor_26_dir):
+        build_waveform_store(actor_dir)
 
 def get_emotion_code(emotion: str) -> int:
     """
@@ -121,18 +225,7 @@ def get_emotion_code(emotion: str) -> int:
     Returns:
         Emotion code (1-8)
     """
-    emotion_codes = {
-        "neutral": 1,
-        "calm": 2,
-        "happy": 3,
-        "sad": 4,
-        "angry": 5,
-        "fear": 6,
-        "disgust": 7,
-        "surprised": 8
-    }
-    
-    return emotion_codes.get(emotion, 1)
+    return _EMOTION_CODES.get(emotion, 1)
 
 def validate_tess_structure(source_dir: Optional[Path] = None) -> Dict[str, bool]:
     """
@@ -156,20 +249,16 @@ def validate_tess_structure(source_dir: Optional[Path] = None) -> Dict[str, bool
     if not results["directory_exists"]:
         return results
     
-    # Check for audio files
-    audio_files = list(source_dir.rglob("*.wav"))
-    results["has_audio_files"] = len(audio_files) > 0
-    
-    # Check structure (simplified)
-    if audio_files:
-        # Check if files follow expected naming pattern
-        valid_files = 0
-        for audio_file in audio_files:
-            filename = audio_file.stem
-            if '_' in filename and any(emotion in filename.lower() for emotion in TESS_EMOTION_MAP.keys()):
-                valid_files += 1
-        
-        results["has_expected_structure"] = valid_files > 0
+    # Check for audio files; stops at the first one found
+    results["has_audio_files"] = next(_walk_wav(source_dir), None) is not None
+    
+    # Check structure (simplified): stops at the first file that follows the
+    # expected naming pattern
+    if results["has_audio_files"]:
+        results["has_expected_structure"] = any(
+            '_' in audio_file.stem and any(emotion in audio_file.stem.lower() for emotion in TESS_EMOTION_MAP)
+            for audio_file in _walk_wav(source_dir)
+        )
     
     return results
 
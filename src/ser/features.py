@@ -3,25 +3,223 @@ Feature extraction utilities for Speech Emotion Recognition.
 Extracts MFCC features from audio files and manages feature persistence.
 """
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import io
+import json
+import os
 import numpy as np
 import librosa
+import numba
+import scipy.fft
+import scipy.fftpack
+import soundfile as sf
 import joblib
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Iterator, List, Tuple, Optional, Union
 import logging
 
-from .config import FEATURES_DIR, DATASET_FEATURES_DIR, ensure_dirs_exist
+from .config import FEATURES_DIR, DATASET_FEATURES_DIR, TARGET_SR, ensure_dirs_exist
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def extract_features(audio_path: Path) -> np.ndarray:
+# MFCC settings (librosa.feature.mfcc defaults)
+N_MFCC = 40
+N_MELS = 128
+N_FFT = 2048
+HOP_LENGTH = 512
+
+# The mel filterbank and DCT basis only depend on the settings above, so they
+# are built once at import instead of inside every librosa.feature.mfcc call
+_MEL_FB = librosa.filters.mel(sr=TARGET_SR, n_fft=N_FFT, n_mels=N_MELS)
+_DCT = scipy.fftpack.dct(np.eye(N_MELS), type=2, norm="ortho", axis=0)[:N_MFCC].astype(np.float32)
+
+# librosa.stft's periodic Hann window, and the filterbank in banded form: each
+# mel filter is nonzero over a short run of FFT bins [_MEL_LO, _MEL_HI), with
+# its weights left-aligned in _MEL_W
+_STFT_WINDOW = librosa.filters.get_window("hann", N_FFT, fftbins=True).astype(np.float32)
+_MEL_NZ = _MEL_FB != 0
+_MEL_LO = _MEL_NZ.argmax(axis=1)
+_MEL_HI = _MEL_FB.shape[1] - _MEL_NZ[:, ::-1].argmax(axis=1)
+_MEL_W = np.zeros((N_MELS, (_MEL_HI - _MEL_LO).max()), dtype=np.float32)
+for _m in range(N_MELS):
+    _MEL_W[_m, :_MEL_HI[_m] - _MEL_LO[_m]] = _MEL_FB[_m, _MEL_LO[_m]:_MEL_HI[_m]]
+del _MEL_NZ, _m
+
+# Files per batched MFCC pass when building dataset features
+FEATURE_BATCH_SIZE = 32
+
+# Files longer than this are streamed in fixed-size blocks to bound memory
+STREAM_MIN_SECONDS = 30
+STREAM_BLOCK_SECONDS = 10
+
+# WAV files up to this size are read into memory in one call before decoding
+PRELOAD_MAX_BYTES = 32 * 1024 * 1024
+
+# RAVDESS filename emotion codes to labels
+_RAVDESS_EMOTIONS = {
+    1: "neutral", 2: "calm", 3: "happy", 4: "sad",
+    5: "angry", 6: "fear", 7: "disgust", 8: "surprised"
+}
+
+# Concatenated waveform store written next to a directory's .wav files
+WAVEFORMS_FILE = "waveforms.bin"
+OFFSETS_FILE = "offsets.npy"
+LABELS_FILE = "labels.npy"
+MANIFEST_FILE = "manifest.json"
+
+# Audio comes from disk, or from an in-memory buffer for web uploads
+AudioSource = Union[Path, BinaryIO]
+
+def _as_input(source: AudioSource) -> Union[str, BinaryIO]:
+    """Return a path string or a rewound buffer that soundfile/librosa can open."""
+    if isinstance(source, Path):
+        return str(source)
+    source.seek(0)
+    return source
+
+def _source_name(source: AudioSource) -> str:
+    """Human-readable name of an audio source for messages and results."""
+    if isinstance(source, Path):
+        return str(source)
+    return str(getattr(source, "name", "<buffer>"))
+
+def _preload(source: AudioSource) -> AudioSource:
+    """
+    Read a WAV file into a named in-memory buffer with a single read.
+    
+    Header parsing and decoding then work on memory instead of issuing many
+    small reads against the file. Buffers, non-WAV files (which may need
+    librosa's path-based fallback) and files over PRELOAD_MAX_BYTES are
+    returned unchanged.
+    """
+    if not isinstance(source, Path) or source.suffix.lower() != ".wav":
+        return source
+    try:
+        if source.stat().st_size > PRELOAD_MAX_BYTES:
+            return source
+        buffer = io.BytesIO(source.read_bytes())
+    except OSError:
+        return source
+    buffer.name = str(source)
+    return buffer
+
+def load_audio(audio_path: AudioSource, sr: int = TARGET_SR, res_type: str = "soxr_hq") -> Tuple[np.ndarray, int]:
+    """
+    Decode an audio file to a mono float32 signal at the requested sample rate.
+    
+    WAV files are decoded at their native rate with soundfile, which avoids
+    librosa's audioread/resampy path; resampling only happens when the
+    file's native rate differs from sr.
+    
+    Args:
+        audio_path: Path to the audio file, or a binary buffer
+        sr: Target sample rate (TARGET_SR for features)
+        res_type: librosa resampler used when the native rate differs
+        
+    Returns:
+        Tuple of (signal, sample_rate)
+    """
+    try:
+        x, native_sr = sf.read(_as_input(audio_path), dtype="float32", always_2d=False)
+    except RuntimeError:
+        # Formats libsndfile cannot decode still go through librosa
+        return librosa.load(_as_input(audio_path), sr=sr, res_type=res_type)
+    
+    # Downmix multi-channel audio to mono
+    if x.ndim == 2:
+        x = x.mean(axis=1)
+    
+    if native_sr != sr:
+        x = librosa.resample(x, orig_sr=native_sr, target_sr=sr, res_type=res_type)
+    
+    return x, sr
+
+def _frame_spectrum(x: np.ndarray) -> np.ndarray:
+    """
+    Centered STFT of a signal as (frames, bins), one contiguous row per frame.
+    
+    Same framing as librosa.stft (zero padding, Hann window), but the
+    strided frame view goes straight into one real FFT.
+    """
+    padded = np.pad(x.astype(np.float32, copy=False), N_FFT // 2)
+    frames = np.lib.stride_tricks.sliding_window_view(padded, N_FFT)[::HOP_LENGTH]
+    return scipy.fft.rfft(frames * _STFT_WINDOW, axis=1)
+
+@numba.njit(fastmath=True, cache=True, nogil=True)
+def _mean_log_mel(spec: np.ndarray, mel_w: np.ndarray, mel_lo: np.ndarray, mel_hi: np.ndarray) -> np.ndarray:
+    """
+    Time-mean of the dB mel spectrogram of a complex (frames, bins) STFT.
+    
+    Power, the banded filterbank dot product and the log are fused into one
+    pass per frame, reusing a single row of power values, so no power or
+    mel spectrogram is built beside the (frames, n_mels) dB buffer; the
+    80 dB floor relative to the peak (power_to_db's top_db) is applied
+    while averaging. Runs without the GIL, so threads can share it.
+    """
+    n_frames, n_bins = spec.shape
+    n_mels = mel_w.shape[0]
+    amin = np.float32(1e-10)
+    
+    log_mel = np.empty((n_frames, n_mels), dtype=np.float32)
+    power = np.empty(n_bins, dtype=np.float32)
+    for t in range(n_frames):
+        for f in range(n_bins):
+            v = spec[t, f]
+            power[f] = v.real * v.real + v.imag * v.imag
+        for m in range(n_mels):
+            lo = mel_lo[m]
+            acc = np.float32(0.0)
+            for k in range(mel_hi[m] - lo):
+                acc += mel_w[m, k] * power[lo + k]
+            log_mel[t, m] = np.float32(10.0) * np.log10(max(acc, amin))
+    
+    floor = log_mel.max() - np.float32(80.0)
+    mean = np.zeros(n_mels, dtype=np.float32)
+    for t in range(n_frames):
+        for m in range(n_mels):
+            mean[m] += max(log_mel[t, m], floor)
+    return mean / np.float32(n_frames)
+
+def _fast_mean_mfcc(x: np.ndarray) -> np.ndarray:
+    """Mean MFCC vector of a TARGET_SR signal without building the (N_MFCC, frames) matrix."""
+    # The DCT is linear, so transforming the mean log-mel equals the mean MFCC
+    return _DCT @ _mean_log_mel(_frame_spectrum(x), _MEL_W, _MEL_LO, _MEL_HI)
+
+def _extract_features_streaming(audio_path: AudioSource, sr: int) -> np.ndarray:
+    """
+    Compute the mean MFCC of a long file block by block.
+    
+    Memory stays bounded by the block size instead of the file length. Each
+    block is framed and dB-clipped independently, so results differ
+    slightly from a whole-file pass at block edges.
+    """
+    blocksize = STREAM_BLOCK_SECONDS * sr
+    sum_mfcc = np.zeros(N_MFCC, dtype=np.float64)
+    n_frames = 0
+    
+    for block in sf.blocks(_as_input(audio_path), blocksize=blocksize, overlap=0, dtype="float32"):
+        if block.ndim == 2:
+            block = block.mean(axis=1)
+        if sr != TARGET_SR:
+            block = librosa.resample(block, orig_sr=sr, target_sr=TARGET_SR, res_type="soxr_hq")
+        
+        # Weight each block's mean by its centered frame count
+        block_frames = 1 + len(block) // HOP_LENGTH
+        sum_mfcc += _fast_mean_mfcc(block) * block_frames
+        n_frames += block_frames
+    
+    return (sum_mfcc / n_frames).astype(np.float32)
+
+def extract_features(audio_path: AudioSource) -> np.ndarray:
     """
     Extract MFCC features from an audio file.
     
     Args:
-        audio_path: Path to the audio file
+        audio_path: Path to the audio file, or a binary buffer holding one
         
     Returns:
         MFCC features as numpy array
@@ -30,30 +228,308 @@ def extract_features(audio_path: Path) -> np.ndarray:
         FileNotFoundError: If audio file doesn't exist
         ValueError: If audio file cannot be loaded
     """
-    if not audio_path.exists():
+    if isinstance(audio_path, Path) and not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
     
     try:
-        # Load audio with resampling
-        x, sr = librosa.load(str(audio_path), res_type="kaiser_fast")
+        # One read for the whole file; header and samples parse from memory
+        source = _preload(audio_path)
+        
+        # Stream long uploads instead of materializing the whole signal
+        try:
+            info = sf.info(_as_input(source))
+        except RuntimeError:
+            info = None
+        if info is not None and info.duration > STREAM_MIN_SECONDS:
+            return _extract_features_streaming(source, info.samplerate)
+        
+        # Load audio at TARGET_SR, resampling only when needed
+        x, _ = load_audio(source)
+        
+        # Mean MFCC over time in one fused pass
+        return _fast_mean_mfcc(x)
         
-        # Extract MFCC features
-        mfcc = librosa.feature.mfcc(y=x, sr=sr, n_mfcc=40)
-        mfcc_mean = np.mean(mfcc.T, axis=0)
+    except Exception as e:
+        name = _source_name(audio_path)
+        logger.error(f"Error extracting features from {name}: {e}")
+        raise ValueError(f"Failed to extract features from {name}: {e}")
+
+@numba.njit(nogil=True, cache=True)
+def _clipped_frame_mean(log_mel: np.ndarray, n_frames: np.ndarray, top_db: float) -> np.ndarray:
+    """
+    Mean over the first n_frames[i] frames of each (bands, frames) dB slice.
+    
+    Each slice is floored at top_db below its own peak, taken over those
+    same frames, as power_to_db does for a single signal. The padded tail
+    of each slice is never read and no mask-sized temporary is allocated.
+    Serial and GIL-free: callers already run it from worker processes and
+    threads.
+    """
+    n, bands, _ = log_mel.shape
+    out = np.empty((n, bands), dtype=np.float32)
+    for i in range(n):
+        t = n_frames[i]
+        peak = -np.inf
+        for b in range(bands):
+            for j in range(t):
+                peak = max(peak, log_mel[i, b, j])
+        floor = peak - top_db
+        for b in range(bands):
+            acc = 0.0
+            for j in range(t):
+                acc += max(log_mel[i, b, j], floor)
+            out[i, b] = acc / t
+    return out
+
+def _mean_mfcc_batch(signals: List[np.ndarray]) -> np.ndarray:
+    """
+    Mean MFCC vectors for several TARGET_SR signals in one batched pass.
+    
+    Signals are zero-padded to a common length and run through a single
+    STFT and filterbank matmul. Only each signal's own frames enter its
+    mean, and with librosa's zero-padded centered framing those frames are
+    identical to an unbatched call, so results match extract_features.
+    """
+    lengths = np.array([len(x) for x in signals])
+    Y = np.zeros((len(signals), lengths.max()), dtype=np.float32)
+    for i, x in enumerate(signals):
+        Y[i, :len(x)] = x
+    
+    S = np.abs(librosa.stft(Y, n_fft=N_FFT, hop_length=HOP_LENGTH)) ** 2
+    mel = _MEL_FB @ S
+    
+    # power_to_db with librosa's defaults. Frames just past a signal's end
+    # still overlap its last samples, so the 80 dB clip uses the peak over
+    # the signal's own frames only, inside the kernel below
+    log_mel = 10.0 * np.log10(np.maximum(1e-10, mel))
+    
+    # Clip and average each signal's own frames; the DCT is linear, so
+    # averaging log-mel frames first and transforming once gives the same
+    # mean MFCC
+    n_frames = 1 + lengths // HOP_LENGTH
+    mean_log_mel = _clipped_frame_mean(log_mel, n_frames, 80.0)
+    
+    return (mean_log_mel @ _DCT.T).astype(np.float32)
+
+def extract_features_batch(audio_paths: List[Path], batch_size: int = FEATURE_BATCH_SIZE) -> np.ndarray:
+    """
+    Extract MFCC features for several audio files with batched transforms.
+    
+    Audio is decoded on a thread pool, then processed batch_size files at a
+    time with one STFT/mel/DCT pass per batch.
+    
+    Args:
+        audio_paths: Paths to audio files
+        batch_size: Files per batched transform (bounds peak memory)
         
-        return mfcc_mean.astype(np.float32)
+    Returns:
+        Feature matrix of shape (len(audio_paths), N_MFCC)
         
+    Raises:
+        FileNotFoundError: If an audio file doesn't exist
+        ValueError: If an audio file cannot be loaded
+    """
+    for audio_path in audio_paths:
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    X = np.empty((len(audio_paths), N_MFCC), dtype=np.float32)
+    
+    with ThreadPoolExecutor() as executor:
+        for start in range(0, len(audio_paths), batch_size):
+            batch = audio_paths[start:start + batch_size]
+            try:
+                signals = [x for x, _ in executor.map(load_audio, batch)]
+                X[start:start + len(batch)] = _mean_mfcc_batch(signals)
+            except Exception as e:
+                logger.error(f"Error extracting features from batch at {batch[0]}: {e}")
+                raise ValueError(f"Failed to extract features from batch at {batch[0]}: {e}")
+    
+    return X
+
+def _emotion_label(audio_file: Path) -> str:
+    """
+    Parse the emotion label from a RAVDESS-style filename.
+    
+    Raises:
+        ValueError: If the emotion field isn't an integer code
+    """
+    # Expected format: modality-vocal_channel-emotion-intensity-statement-repetition-actor.wav
+    parts = audio_file.stem.split('-')
+    
+    if len(parts) >= 3:
+        emotion_code = int(parts[2])
+        return _RAVDESS_EMOTIONS.get(emotion_code, "unknown")
+    return "unknown"
+
+def _load_labeled(audio_file: Path) -> Optional[Tuple[np.ndarray, str]]:
+    """Decode one file and parse its label, logging and skipping failures."""
+    try:
+        emotion_label = _emotion_label(audio_file)
+        x, _ = load_audio(audio_file)
+        logger.debug(f"Loaded {audio_file.name} -> {emotion_label}")
+        return x, emotion_label
     except Exception as e:
-        logger.error(f"Error extracting features from {audio_path}: {e}")
-        raise ValueError(f"Failed to extract features from {audio_path}: {e}")
+        logger.error(f"Error processing {audio_file}: {e}")
+        return None
+
+def _extract_chunk(audio_files: List[Path]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Extract features for a chunk of files in one batched MFCC pass.
+    
+    Runs in a worker process; decoding is I/O-bound so it's overlapped on
+    threads, then the successfully decoded signals share one transform.
+    """
+    with ThreadPoolExecutor() as executor:
+        loaded = [item for item in executor.map(_load_labeled, audio_files) if item is not None]
+    
+    if not loaded:
+        return np.empty((0, N_MFCC), dtype=np.float32), []
+    
+    signals, labels = zip(*loaded)
+    return _mean_mfcc_batch(list(signals)), list(labels)
+
+def _iter_wav(directory: Path) -> Iterator[Path]:
+    """Yield the .wav files directly inside a directory via os.scandir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Name check first so non-matches never need a stat or a Path
+            if entry.name.endswith(".wav") and entry.is_file():
+                yield Path(entry.path)
+
+def _wav_manifest(audio_dir: Path) -> List[List[Union[str, int]]]:
+    """Sorted [name, size, mtime_ns] of the .wav files directly inside audio_dir."""
+    manifest = []
+    with os.scandir(audio_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".wav") and entry.is_file():
+                st = entry.stat()
+                manifest.append([entry.name, st.st_size, st.st_mtime_ns])
+    return sorted(manifest)
+
+def build_waveform_store(audio_dir: Path) -> int:
+    """
+    Concatenate a directory's audio into one memory-mappable waveform store.
+    
+    Writes four files into audio_dir: waveforms.bin (every signal decoded
+    to float32 at TARGET_SR, back to back), offsets.npy ((N, 2) start and
+    length in samples), labels.npy (emotion labels) and manifest.json (name,
+    size and mtime of each .wav file the store was built from). Feature
+    builds can then read signals by index instead of opening and decoding
+    each file.
+    
+    Args:
+        audio_dir: Directory containing RAVDESS-named .wav files
+        
+    Returns:
+        Number of signals written to the store
+    """
+    manifest = _wav_manifest(audio_dir)
+    audio_files = [audio_dir / name for name, _, _ in manifest]
+    offsets = []
+    labels = []
+    start = 0
+    
+    with open(audio_dir / WAVEFORMS_FILE, "wb") as f, ThreadPoolExecutor() as executor:
+        for item in executor.map(_load_labeled, audio_files):
+            if item is None:
+                continue
+            x, label = item
+            x.astype(np.float32, copy=False).tofile(f)
+            offsets.append((start, len(x)))
+            labels.append(label)
+            start += len(x)
+    
+    np.save(audio_dir / OFFSETS_FILE, np.array(offsets, dtype=np.int64).reshape(-1, 2))
+    np.save(audio_dir / LABELS_FILE, np.array(labels))
+    # Written last: a store without a manifest is never used
+    (audio_dir / MANIFEST_FILE).write_text(json.dumps({"files": manifest}))
+    
+    # Drop any stale mapping of the previous store in this process
+    _open_waveform_store.cache_clear()
+    
+    logger.info(f"Wrote waveform store for {len(labels)} files ({start} samples) to {audio_dir}")
+    return len(labels)
+
+def has_waveform_store(audio_dir: Path) -> bool:
+    """
+    Check whether audio_dir holds an up-to-date waveform store.
+    
+    The store only counts when its manifest still matches the directory's
+    .wav files; a store built before files were added, removed or changed
+    would otherwise shadow the audio on disk.
+    """
+    names = (WAVEFORMS_FILE, OFFSETS_FILE, LABELS_FILE, MANIFEST_FILE)
+    if not all((audio_dir / name).exists() for name in names):
+        return False
+    
+    try:
+        stored = json.loads((audio_dir / MANIFEST_FILE).read_text())["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    
+    if stored != _wav_manifest(audio_dir):
+        logger.warning(f"Waveform store in {audio_dir} is out of date; rebuild it with build_waveform_store")
+        return False
+    return True
+
+@lru_cache(maxsize=None)
+def _open_waveform_store(store_dir: Path) -> Tuple[Optional[np.memmap], np.ndarray, np.ndarray]:
+    """Map a waveform store once per process; returns (waveforms, offsets, labels)."""
+    offsets = np.load(store_dir / OFFSETS_FILE)
+    labels = np.load(store_dir / LABELS_FILE)
+    # np.memmap cannot map an empty file
+    waveforms = np.memmap(store_dir / WAVEFORMS_FILE, dtype=np.float32, mode="r") if offsets[:, 1].sum() else None
+    return waveforms, offsets, labels
+
+def load_waveform(i: int, store_dir: Path) -> np.ndarray:
+    """
+    Return signal i of a waveform store as a read-only memory-mapped view.
+    
+    Args:
+        i: Index of the signal in the store
+        store_dir: Directory holding the store
+        
+    Returns:
+        float32 signal at TARGET_SR
+    """
+    waveforms, offsets, _ = _open_waveform_store(store_dir)
+    start, length = offsets[i]
+    return waveforms[start:start + length]
 
-def process_audio_directory(audio_dir: Path, output_dir: Path) -> None:
+def _extract_store_chunk(store_dir: Path, start: int, stop: int) -> Tuple[np.ndarray, List[str]]:
+    """Extract features for store indices [start, stop) in one batched MFCC pass."""
+    _, _, labels = _open_waveform_store(store_dir)
+    signals = [load_waveform(i, store_dir) for i in range(start, stop)]
+    return _mean_mfcc_batch(signals), labels[start:stop].tolist()
+
+def quantize_features(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize a feature matrix to int8 with one symmetric scale per column.
+    
+    Args:
+        X: Float feature matrix of shape (N, n_features)
+        
+    Returns:
+        Tuple of (X_q, scale) with X ≈ X_q * scale
+    """
+    scale = (np.max(np.abs(X), axis=0) / 127).astype(np.float32)
+    # All-zero columns would divide by zero; any scale reproduces them
+    scale[scale == 0] = 1.0
+    X_q = np.clip(np.round(X / scale), -128, 127).astype(np.int8)
+    return X_q, scale
+
+def process_audio_directory(audio_dir: Path, output_dir: Path, quantize: bool = False) -> None:
     """
     Process all audio files in a directory and save features.
     
+    Uses the directory's waveform store (see build_waveform_store) when one
+    exists and still matches the .wav files, otherwise decodes each file.
+    
     Args:
         audio_dir: Directory containing audio files
         output_dir: Directory to save extracted features
+        quantize: Store X as int8 (X_q.npy + scale.npy) instead of float32
     """
     if not audio_dir.exists():
         logger.warning(f"Audio directory not found: {audio_dir}")
@@ -62,67 +538,75 @@ def process_audio_directory(audio_dir: Path, output_dir: Path) -> None:
     ensure_dirs_exist()
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    audio_files = list(audio_dir.glob("*.wav"))
-    if not audio_files:
-        logger.warning(f"No .wav files found in {audio_dir}")
-        return
+    if has_waveform_store(audio_dir):
+        # Read decoded signals by index from the store instead of opening every file
+        n_signals = len(_open_waveform_store(audio_dir)[1])
+        if not n_signals:
+            logger.warning(f"Waveform store in {audio_dir} is empty")
+            return
+        
+        logger.info(f"Processing {n_signals} stored waveforms from {audio_dir}")
+        
+        n_inputs = n_signals
+        starts = range(0, n_signals, FEATURE_BATCH_SIZE)
+        stops = [min(start + FEATURE_BATCH_SIZE, n_signals) for start in starts]
+        extract_chunk, chunk_args = _extract_store_chunk, ([audio_dir] * len(stops), starts, stops)
+    else:
+        audio_files = list(_iter_wav(audio_dir))
+        if not audio_files:
+            logger.warning(f"No .wav files found in {audio_dir}")
+            return
+        
+        logger.info(f"Processing {len(audio_files)} audio files from {audio_dir}")
+        
+        # Batch files so each worker process runs one STFT/mel/DCT pass per chunk
+        n_inputs = len(audio_files)
+        chunks = [audio_files[i:i + FEATURE_BATCH_SIZE] for i in range(0, len(audio_files), FEATURE_BATCH_SIZE)]
+        extract_chunk, chunk_args = _extract_chunk, (chunks,)
     
-    logger.info(f"Processing {len(audio_files)} audio files from {audio_dir}")
+    # Write chunk results into buffers sized for every input as they arrive;
+    # the cursor skips files that failed to decode
+    X_buf = np.empty((n_inputs, N_MFCC), dtype=np.float32)
+    y_buf = [None] * n_inputs
+    k = 0
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for features, labels in executor.map(extract_chunk, *chunk_args):
+            X_buf[k:k + len(labels)] = features
+            y_buf[k:k + len(labels)] = labels
+            k += len(labels)
     
-    features_list = []
-    labels_list = []
+    X = X_buf[:k]
+    labels_list = y_buf[:k]
     
-    for audio_file in audio_files:
-        try:
-            # Extract emotion label from filename
-            # Expected format: modality-vocal_channel-emotion-intensity-statement-repetition-actor.wav
-            filename = audio_file.stem
-            parts = filename.split('-')
-            
-            if len(parts) >= 3:
-                emotion_code = int(parts[2])
-                # Map emotion codes to labels
-                emotion_map = {
-                    1: "neutral", 2: "calm", 3: "happy", 4: "sad",
-                    5: "angry", 6: "fear", 7: "disgust", 8: "surprised"
-                }
-                emotion_label = emotion_map.get(emotion_code, "unknown")
-            else:
-                emotion_label = "unknown"
-            
-            # Extract features
-            features = extract_features(audio_file)
-            
-            features_list.append(features)
-            labels_list.append(emotion_label)
-            
-            logger.debug(f"Processed {audio_file.name} -> {emotion_label}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {audio_file}: {e}")
-            continue
-    
-    if features_list:
+    if labels_list:
         # Convert to numpy arrays
-        X = np.array(features_list)
         y = np.array(labels_list)
         
-        # Save features
-        features_path = output_dir / "X.joblib"
-        labels_path = output_dir / "y.joblib"
-        
-        joblib.dump(X, features_path)
-        joblib.dump(y, labels_path)
+        # Save features as raw .npy so load_features can memory-map X, and
+        # drop the other format so load_features can't pick up a stale copy
+        if quantize:
+            X_q, scale = quantize_features(X)
+            np.save(output_dir / "X_q.npy", X_q)
+            np.save(output_dir / "scale.npy", scale)
+            (output_dir / "X.npy").unlink(missing_ok=True)
+        else:
+            np.save(output_dir / "X.npy", X)
+            (output_dir / "X_q.npy").unlink(missing_ok=True)
+            (output_dir / "scale.npy").unlink(missing_ok=True)
+        np.save(output_dir / "y.npy", y)
         
-        logger.info(f"Saved {len(features_list)} feature vectors to {output_dir}")
+        logger.info(f"Saved {len(labels_list)} feature vectors to {output_dir}")
         logger.info(f"Feature shape: {X.shape}")
-        logger.info(f"Label distribution: {np.bincount(np.unique(y, return_inverse=True)[1])}")
+        logger.info(f"Label distribution: {dict(Counter(labels_list))}")
     else:
         logger.warning("No features extracted successfully")
 
-def create_all_features() -> None:
+def create_all_features(quantize: bool = False) -> None:
     """
     Create features for all audio directories (Actor_25 and Actor_26).
+    
+    Args:
+        quantize: Store X as int8 with per-column scales
     """
     ensure_dirs_exist()
     
@@ -131,31 +615,56 @@ def create_all_features() -> None:
         actor_dir = FEATURES_DIR / actor
         if actor_dir.exists():
             logger.info(f"Processing {actor}...")
-            process_audio_directory(actor_dir, DATASET_FEATURES_DIR)
+            process_audio_directory(actor_dir, DATASET_FEATURES_DIR, quantize=quantize)
         else:
             logger.warning(f"Directory not found: {actor_dir}")
 
-def load_features() -> Tuple[np.ndarray, np.ndarray]:
+def load_features(dtype: np.dtype = np.float32) -> Tuple[np.ndarray, np.ndarray]:
     """
     Load pre-computed features from disk.
     
+    Prefers the X.npy/y.npy pair, with X memory-mapped read-only; then an
+    int8 X_q.npy/scale.npy pair, dequantized on load; and finally legacy
+    X.joblib/y.joblib files.
+    
+    Args:
+        dtype: Float dtype of the returned features
+        
     Returns:
         Tuple of (X, y) where X is features and y is labels
         
     Raises:
         FileNotFoundError: If feature files don't exist
     """
-    X_path = DATASET_FEATURES_DIR / "X.joblib"
-    y_path = DATASET_FEATURES_DIR / "y.joblib"
+    X_path = DATASET_FEATURES_DIR / "X.npy"
+    X_q_path = DATASET_FEATURES_DIR / "X_q.npy"
+    scale_path = DATASET_FEATURES_DIR / "scale.npy"
+    y_path = DATASET_FEATURES_DIR / "y.npy"
     
-    if not X_path.exists() or not y_path.exists():
-        raise FileNotFoundError(
-            f"Feature files not found. Expected: {X_path}, {y_path}. "
-            "Run create_all_features() first."
-        )
-    
-    X = joblib.load(X_path)
-    y = joblib.load(y_path)
+    if X_path.exists() and y_path.exists():
+        # Memory-mapped: pages are read on demand instead of copied up front;
+        # the default float32 keeps the mapping, other dtypes copy
+        X = np.load(X_path, mmap_mode="r").astype(dtype, copy=False)
+        y = np.load(y_path)
+    elif X_q_path.exists() and scale_path.exists() and y_path.exists():
+        # Dequantize straight into one preallocated buffer
+        X_q = np.load(X_q_path, mmap_mode="r")
+        X = np.empty(X_q.shape, dtype=dtype)
+        np.multiply(X_q, np.load(scale_path).astype(dtype), out=X)
+        y = np.load(y_path)
+    else:
+        # Fall back to features saved by older versions
+        legacy_X_path = DATASET_FEATURES_DIR / "X.joblib"
+        legacy_y_path = DATASET_FEATURES_DIR / "y.joblib"
+        
+        if not legacy_X_path.exists() or not legacy_y_path.exists():
+            raise FileNotFoundError(
+                f"Feature files not found. Expected: {X_path}, {y_path}. "
+                "Run create_all_features() first."
+            )
+        
+        X = np.asarray(joblib.load(legacy_X_path)).astype(dtype, copy=False)
+        y = joblib.load(legacy_y_path)
     
     logger.info(f"Loaded features: X={X.shape}, y={y.shape}")
     return X, y
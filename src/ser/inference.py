@@ -4,89 +4,333 @@ Provides a simple CLI for running predictions on audio files.
 """
 
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import socket
+import stat
 import sys
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
 
-from .model import predict_path
-from .config import get_model_path, EXAMPLES_DIR
+import numpy as np
+
+from .features import extract_features
+from .model import predict_path, predict_emotion, predict_emotion_batch, get_cached_model
+from .config import EXAMPLES_DIR
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def predict_file(audio_path: Path, model_path: Optional[Path] = None) -> None:
+# Below this many files the thread pool costs more than it saves
+MIN_FILES_FOR_POOL = 4
+
+# Files per forward pass in directory mode
+PREDICT_BATCH_SIZE = 32
+
+def _default_socket() -> Path:
+    """Per-user default socket path, so other users can't pre-create or take it over."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "ser.sock"
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return Path(tempfile.gettempdir()) / f"ser-{uid}.sock"
+
+# Default Unix socket for --serve
+SERVE_SOCKET = _default_socket()
+
+# Seconds a --serve client may stay idle before its connection is dropped
+SERVE_TIMEOUT = 30.0
+
+def _try_extract(audio_file: Path) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Extract features, returning (features, None) or (None, error message)."""
+    try:
+        return extract_features(audio_file), None
+    except Exception as e:
+        return None, str(e)
+
+def _write_json(record: dict) -> None:
+    """Write one compact JSON line to stdout."""
+    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+def predict_file(
+    audio_path: Path,
+    model_path: Optional[Path] = None,
+    as_json: bool = False,
+    safe_load: bool = False
+) -> None:
     """
     Predict emotion for a single audio file and print results.
     
     Args:
         audio_path: Path to audio file
         model_path: Path to model file (optional)
+        as_json: Print the result as one JSON line instead of a report
+        safe_load: Rebuild the model from its weights if direct loading fails
     """
     try:
-        result = predict_path(audio_path, model_path)
+        result = predict_path(audio_path, model_path, safe_load)
         
-        print(f"\n🎵 File: {result['file']}")
-        print(f"😊 Emotion: {result['pred_label']}")
-        print(f"📊 Confidence: {result['confidence']:.2%}")
-        print(f"🔢 Prediction Index: {result['pred_index']}")
+        if as_json:
+            _write_json(result)
+            sys.stdout.flush()
+            return
+        
+        lines = [
+            f"\n🎵 File: {result['file']}",
+            f"😊 Emotion: {result['pred_label']}",
+            f"📊 Confidence: {result['confidence']:.2%}",
+            f"🔢 Prediction Index: {result['pred_index']}",
+        ]
         
         # Show all probabilities
-        print("\n📈 All Probabilities:")
-        for i, (emotion, prob) in enumerate(zip(result.get('emotions', []), result['probs'])):
-            print(f"  {emotion}: {prob:.2%}")
+        lines.append("\n📈 All Probabilities:")
+        lines.extend(
+            f"  {emotion}: {prob:.2%}"
+            for emotion, prob in zip(result.get('emotions', []), result['probs'])
+        )
+        
+        # One write for the whole report
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
             
     except Exception as e:
         logger.error(f"Error predicting {audio_path}: {e}")
-        print(f"❌ Error: {e}")
+        if as_json:
+            _write_json({"file": str(audio_path), "error": str(e)})
+        else:
+            print(f"❌ Error: {e}")
         sys.exit(1)
 
-def predict_directory(directory: Path, model_path: Optional[Path] = None) -> None:
+def _predict_stream(
+    audio_files: List[Path],
+    extracted: Iterable[Tuple[Optional[np.ndarray], Optional[str]]],
+    model_path: Optional[Path] = None,
+    as_json: bool = False,
+    safe_load: bool = False
+) -> Tuple[List[Path], List[str], List[float], List[np.ndarray], Dict[Path, str]]:
+    """
+    Predict on extracted features in micro-batches as they arrive.
+    
+    Args:
+        audio_files: Audio files, in the order extracted yields them
+        extracted: (features, error) per file, as returned by _try_extract
+        model_path: Path to model file (optional)
+        as_json: Leave extraction errors to the caller instead of printing
+            them to stderr as they happen
+        safe_load: Rebuild the model from its weights if direct loading fails
+        
+    Returns:
+        Tuple of (files, labels, confidences, probs, errors): the first
+        four cover files that extracted successfully, in input order, with
+        one (n, C) probs array per micro-batch; errors maps each failed
+        file to its error message
+    """
+    model = None
+    errors: Dict[Path, str] = {}
+    ok_files: List[Path] = []
+    labels: List[str] = []
+    confidences: List[float] = []
+    probs: List[np.ndarray] = []
+    pending_files: List[Path] = []
+    pending_features: List[np.ndarray] = []
+    
+    def flush() -> None:
+        nonlocal model
+        if model is None:
+            model = get_cached_model(model_path, safe_load)
+        batch_labels, batch_confidences, batch_probs = predict_emotion_batch(
+            model, pending_files, features=np.stack(pending_features)
+        )
+        ok_files.extend(pending_files)
+        labels.extend(batch_labels)
+        confidences.extend(batch_confidences.tolist())
+        probs.append(batch_probs)
+        pending_files.clear()
+        pending_features.clear()
+    
+    for audio_file, (feats, error) in zip(audio_files, extracted):
+        if error is not None:
+            logger.error(f"Error processing {audio_file}: {error}")
+            errors[audio_file] = error
+            if not as_json:
+                print(f"❌ {audio_file.name}: Error - {error}", file=sys.stderr, flush=True)
+            continue
+        
+        pending_files.append(audio_file)
+        pending_features.append(feats)
+        if len(pending_files) == PREDICT_BATCH_SIZE:
+            flush()
+    
+    if pending_files:
+        flush()
+    
+    return ok_files, labels, confidences, probs, errors
+
+def _exit_with_error(message: str, path: Optional[Path] = None, as_json: bool = False) -> None:
+    """Report a fatal error as text or as a JSON error line, then exit."""
+    if as_json:
+        record = {"error": message} if path is None else {"file": str(path), "error": message}
+        _write_json(record)
+        sys.stdout.flush()
+    else:
+        print(f"❌ {message}: {path}" if path is not None else f"❌ {message}")
+    sys.exit(1)
+
+def predict_directory(
+    directory: Path,
+    model_path: Optional[Path] = None,
+    as_json: bool = False,
+    summary: bool = True,
+    safe_load: bool = False
+) -> None:
     """
     Predict emotions for all audio files in a directory.
     
     Args:
         directory: Directory containing audio files
         model_path: Path to model file (optional)
+        as_json: Print one JSON line per file instead of a report
+        summary: Include the emotion distribution summary
+        safe_load: Rebuild the model from its weights if direct loading fails
     """
     if not directory.exists():
-        print(f"❌ Directory not found: {directory}")
-        sys.exit(1)
+        _exit_with_error("Directory not found", directory, as_json)
     
     audio_files = list(directory.glob("*.wav"))
     if not audio_files:
-        print(f"❌ No .wav files found in {directory}")
-        sys.exit(1)
+        _exit_with_error("No .wav files found", directory, as_json)
     
-    print(f"🎵 Processing {len(audio_files)} audio files...")
+    if not as_json:
+        print(f"🎵 Processing {len(audio_files)} audio files...")
     
-    results = []
-    for audio_file in audio_files:
-        try:
-            result = predict_path(audio_file, model_path)
-            results.append(result)
-            
-            print(f"✅ {audio_file.name}: {result['pred_label']} ({result['confidence']:.2%})")
-            
-        except Exception as e:
-            logger.error(f"Error processing {audio_file}: {e}")
-            print(f"❌ {audio_file.name}: Error - {e}")
+    # Extract features across cores on threads (decoding, the FFT and the
+    # mel kernel release the GIL); forking after TensorFlow has started its
+    # threads can deadlock. Errors come back per file so one bad file
+    # doesn't sink the batch. Results are consumed as they arrive, so the
+    # model loads and predicts while later files are still extracting.
+    if len(audio_files) < MIN_FILES_FOR_POOL:
+        ok_files, labels, confidences, probs, errors = _predict_stream(
+            audio_files, map(_try_extract, audio_files), model_path, as_json, safe_load
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            ok_files, labels, confidences, probs, errors = _predict_stream(
+                audio_files, executor.map(_try_extract, audio_files), model_path, as_json, safe_load
+            )
+    
+    emotion_counts = Counter(labels)
+    
+    if as_json:
+        # One line per file in input order, failures included
+        all_probs = np.concatenate(probs) if probs else np.empty((0, 0), dtype=np.float32)
+        results = iter(zip(labels, confidences, all_probs))
+        for audio_file in audio_files:
+            if audio_file in errors:
+                _write_json({"file": str(audio_file), "error": errors[audio_file]})
+                continue
+            label, confidence, row = next(results)
+            _write_json({
+                "file": str(audio_file),
+                "pred_index": int(row.argmax()),
+                "pred_label": label,
+                "confidence": round(confidence, 4),
+                "probs": row.tolist()
+            })
+        if summary:
+            _write_json({"summary": {"files": len(labels), "emotions": dict(sorted(emotion_counts.items()))}})
+        sys.stdout.flush()
+        return
+    
+    # Collect the report and write it in one go rather than a print per file
+    lines = [
+        f"✅ {audio_file.name}: {label} ({confidence:.2%})"
+        for audio_file, label, confidence in zip(ok_files, labels, confidences)
+    ]
     
     # Summary
-    if results:
-        print(f"\n📊 Summary: Processed {len(results)} files successfully")
-        
-        # Count emotions
-        emotion_counts = {}
-        for result in results:
-            emotion = result['pred_label']
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+    if labels and summary:
+        lines.append(f"\n📊 Summary: Processed {len(labels)} files successfully")
         
-        print("🎭 Emotion Distribution:")
+        lines.append("🎭 Emotion Distribution:")
         for emotion, count in sorted(emotion_counts.items()):
-            percentage = (count / len(results)) * 100
-            print(f"  {emotion}: {count} ({percentage:.1f}%)")
+            percentage = (count / len(labels)) * 100
+            lines.append(f"  {emotion}: {count} ({percentage:.1f}%)")
+    
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+def serve(sock_path: Path, model_path: Optional[Path] = None, safe_load: bool = False) -> None:
+    """
+    Serve predictions over a Unix socket with the model kept loaded.
+    
+    Clients send newline-delimited audio paths; each gets one JSON line
+    back, the prediction result or {"file": ..., "error": ...}.
+    Connections are handled one at a time until interrupted.
+    
+    Args:
+        sock_path: Unix socket path to listen on
+        model_path: Path to model file (optional)
+        safe_load: Rebuild the model from its weights if direct loading fails
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ --serve needs Unix domain sockets, which this platform lacks")
+        sys.exit(1)
+    
+    # Load once; every request reuses the resident model
+    model = get_cached_model(model_path, safe_load)
+    
+    # Replace a socket left behind by a previous server, but never delete
+    # anything else that happens to live at the path
+    try:
+        existing = os.lstat(sock_path)
+    except FileNotFoundError:
+        existing = None
+    if existing is not None:
+        if not stat.S_ISSOCK(existing.st_mode):
+            print(f"❌ {sock_path} exists and is not a socket; pass a different --serve path")
+            sys.exit(1)
+        sock_path.unlink()
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(sock_path))
+        bound_ino = os.lstat(sock_path).st_ino
+        server.listen()
+        print(f"🚀 Serving predictions on {sock_path}", flush=True)
+        
+        try:
+            while True:
+                conn, _ = server.accept()
+                # An idle client would otherwise block every other client
+                conn.settimeout(SERVE_TIMEOUT)
+                with conn, conn.makefile("r", encoding="utf-8") as requests:
+                    try:
+                        for line in requests:
+                            audio_path = line.strip()
+                            if not audio_path:
+                                continue
+                            try:
+                                result = predict_emotion(model, Path(audio_path))
+                            except Exception as e:
+                                result = {"file": audio_path, "error": str(e)}
+                            conn.sendall(json.dumps(result).encode("utf-8") + b"\n")
+                    except OSError:
+                        # Client went away or timed out; wait for the next one
+                        continue
+        finally:
+            # Only remove the socket this server bound, not one that has
+            # since replaced it
+            try:
+                current = os.lstat(sock_path)
+            except FileNotFoundError:
+                current = None
+            if current is not None and stat.S_ISSOCK(current.st_mode) and current.st_ino == bound_ino:
+                sock_path.unlink()
 
 def main():
     """Main CLI entry point."""
@@ -98,6 +342,8 @@ Examples:
   %(prog)s audio.wav                    # Predict single file
   %(prog)s -d examples/                 # Predict all files in directory
   %(prog)s -m models/SER_model.h5 audio.wav  # Use specific model
+  %(prog)s --serve                      # Keep the model loaded on a socket
+  %(prog)s --json -d examples/          # One JSON line per file
         """
     )
     
@@ -119,12 +365,39 @@ Examples:
         help="Path to model file (default: auto-detect)"
     )
     
+    parser.add_argument(
+        "--safe-load",
+        action="store_true",
+        help="Rebuild the model from its weights if it can't be loaded directly"
+    )
+    
     parser.add_argument(
         "--examples",
         action="store_true",
         help="Run predictions on example files"
     )
     
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=SERVE_SOCKET,
+        type=Path,
+        metavar="SOCKET",
+        help=f"Serve newline-delimited paths on a Unix socket (default: {SERVE_SOCKET})"
+    )
+    
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON line per file instead of a report"
+    )
+    
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="With --json, append a JSON line with the emotion distribution"
+    )
+    
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -137,46 +410,54 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # The text report always ends with the summary; JSON skips it unless asked for
+    if args.summary and not args.json:
+        parser.error("--summary requires --json")
+    summary = args.summary or not args.json
+    
     # Validate model path
     model_path = args.model
     if model_path and not model_path.exists():
-        print(f"❌ Model file not found: {model_path}")
-        sys.exit(1)
+        _exit_with_error("Model file not found", model_path, args.json)
     
     try:
+        # Handle server mode
+        if args.serve:
+            serve(args.serve, model_path, args.safe_load)
+            return
+        
         # Handle examples mode
         if args.examples:
             if EXAMPLES_DIR.exists():
-                predict_directory(EXAMPLES_DIR, model_path)
+                predict_directory(EXAMPLES_DIR, model_path, args.json, summary, args.safe_load)
             else:
-                print(f"❌ Examples directory not found: {EXAMPLES_DIR}")
-                sys.exit(1)
+                _exit_with_error("Examples directory not found", EXAMPLES_DIR, args.json)
             return
         
         # Handle input argument
         if not args.input:
-            print("❌ No input specified. Use --help for usage information.")
-            sys.exit(1)
+            _exit_with_error("No input specified. Use --help for usage information.", as_json=args.json)
         
         input_path = Path(args.input)
         
         if not input_path.exists():
-            print(f"❌ Input not found: {input_path}")
-            sys.exit(1)
+            _exit_with_error("Input not found", input_path, args.json)
         
         # Process based on type
         if args.directory or input_path.is_dir():
-            predict_directory(input_path, model_path)
+            predict_directory(input_path, model_path, args.json, summary, args.safe_load)
         else:
-            predict_file(input_path, model_path)
+            predict_file(input_path, model_path, args.json, args.safe_load)
             
     except KeyboardInterrupt:
+        if args.json:
+            _exit_with_error("Interrupted by user", as_json=True)
         print("\n⏹️  Interrupted by user")
         sys.exit(1)
     except Exception as e:
+        # e.g. a model that fails to load mid-run in directory mode
         logger.error(f"Unexpected error: {e}")
-        print(f"❌ Unexpected error: {e}")
-        sys.exit(1)
+        _exit_with_error(f"Unexpected error: {e}", as_json=args.json)
 
 if __name__ == "__main__":
     main()
@@ -4,21 +4,31 @@ Handles model loading with fallbacks and input shape adaptation.
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Tuple
+import io
+import os
+import threading
 import numpy as np
 import librosa
 import logging
-from tensorflow import keras
-from tensorflow.keras import layers, models
 
 from .config import EMOTIONS, get_model_path
-from .features import extract_features
+from .features import AudioSource, extract_features, _source_name
+
+# TensorFlow takes seconds to import, so it is only imported where a
+# model is built, loaded or run
+if TYPE_CHECKING:
+    from tensorflow import keras
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Emotion labels indexable by an array of class indices
+_EMOTION_LABELS = np.array(EMOTIONS, dtype=object)
+
 def adapt_input_shape(model: keras.Model, features: np.ndarray) -> np.ndarray:
     """
     Adapt input features to match the model's expected input shape.
@@ -36,7 +46,19 @@ def adapt_input_shape(model: keras.Model, features: np.ndarray) -> np.ndarray:
     if isinstance(inp_shape, list):
         inp_shape = inp_shape[0]
     
-    x = features.copy()
+    # Already batched in the model's layout: hand the array straight through
+    if (
+        isinstance(features, np.ndarray)
+        and features.dtype == np.float32
+        and features.ndim == len(inp_shape)
+        and features.flags.c_contiguous
+        and all(d is None or d == n for d, n in zip(inp_shape[1:], features.shape[1:]))
+    ):
+        return features
+    
+    # Aligned, C-contiguous float32 so TF doesn't cast or copy again; this
+    # only copies when the input isn't already in that form
+    x = np.require(features, dtype=np.float32, requirements=["A", "C"])
     
     # Add batch dimension if missing
     if x.ndim == 1:
@@ -49,60 +71,490 @@ def adapt_input_shape(model: keras.Model, features: np.ndarray) -> np.ndarray:
     logger.debug(f"Input shape: {inp_shape}, Features shape: {x.shape}")
     return x
 
-def build_fallback_model() -> keras.Model:
+def _make_input_adapter(model: keras.Model) -> Callable[[np.ndarray], np.ndarray]:
     """
-    Build the SER model architecture as a fallback when loading fails.
+    Resolve the model's input layout once into a reshape-only closure.
     
-    Returns:
-        Compiled Keras model
+    The model's input shape is fixed after loading, so the checks in
+    adapt_input_shape only need to run once. Models with unknown feature
+    dimensions keep using adapt_input_shape.
+    
+    Single-row inputs are copied into a preallocated per-thread buffer,
+    so the result is only valid until the next call on the same thread.
     """
-    model = models.Sequential(name="ser_cnn")
+    inp_shape = model.input_shape
+    if isinstance(inp_shape, list):
+        inp_shape = inp_shape[0]
+    
+    feature_dims = tuple(inp_shape[1:])
+    if any(d is None for d in feature_dims):
+        return lambda features: adapt_input_shape(model, features)
+    
+    target_shape = (-1,) + feature_dims
+    row_size = int(np.prod(feature_dims))
+    
+    # Single-file predictions reuse one (1, *dims) buffer per thread
+    # instead of allocating a new input array on every call
+    local = threading.local()
+    
+    def adapt(features: np.ndarray) -> np.ndarray:
+        features = np.asarray(features)
+        if features.size == row_size:
+            buf = getattr(local, "buf", None)
+            if buf is None:
+                buf = local.buf = np.empty((1,) + feature_dims, dtype=np.float32)
+            np.copyto(buf.reshape(-1), features.reshape(-1), casting="unsafe")
+            return buf
+        return np.require(
+            features, dtype=np.float32, requirements=["A", "C"]
+        ).reshape(target_shape)
+    
+    return adapt
+
+def _prepare_input(model: keras.Model, features: np.ndarray) -> np.ndarray:
+    """Shape features for the model, using the adapter attached at load time."""
+    prep = getattr(model, "_ser_prep", None)
+    if prep is not None:
+        return prep(features)
+    return adapt_input_shape(model, features)
+
+def _build_ser_cnn(include_dropout: bool, mixed_precision: bool = False) -> keras.Model:
+    """
+    Build the uncompiled SER Conv1D stack, optionally without Dropout.
+    
+    The stack is a functional model with ReLU fused into each Conv1D, so
+    XLA sees one conv+activation op per block. Layer names with weights
+    match the original Sequential model, so its weights load by name.
+    
+    With mixed_precision, layers compute in float16 while keeping float32
+    weights; the final softmax always runs in float32.
+    """
+    from tensorflow import keras
+    from tensorflow.keras import layers, models
+    
+    # Features are (batch, steps, channels); every layer pins the matching
+    # data_format, so the caller's global Keras image format is left alone
+    dtype = "mixed_float16" if mixed_precision else None
+    inputs = keras.Input(shape=(40, 1), name='mfcc')
     
     # First Conv1D block
-    model.add(layers.Conv1D(64, 5, padding='same', input_shape=(40, 1), name='conv1d_1'))
-    model.add(layers.Activation('relu', name='activation_1'))
-    model.add(layers.Dropout(0.1, name='dropout_1'))
-    model.add(layers.MaxPooling1D(pool_size=4, name='max_pooling1d_1'))
+    h = layers.Conv1D(64, 5, padding='same', activation='relu', data_format='channels_last',
+                      name='conv1d_1', dtype=dtype)(inputs)
+    if include_dropout:
+        h = layers.Dropout(0.1, name='dropout_1', dtype=dtype)(h)
+    h = layers.MaxPooling1D(pool_size=4, data_format='channels_last', name='max_pooling1d_1', dtype=dtype)(h)
     
     # Second Conv1D block
-    model.add(layers.Conv1D(128, 5, padding='same', name='conv1d_2'))
-    model.add(layers.Activation('relu', name='activation_2'))
-    model.add(layers.Dropout(0.1, name='dropout_2'))
-    model.add(layers.MaxPooling1D(pool_size=4, name='max_pooling1d_2'))
+    h = layers.Conv1D(128, 5, padding='same', activation='relu', data_format='channels_last',
+                      name='conv1d_2', dtype=dtype)(h)
+    if include_dropout:
+        h = layers.Dropout(0.1, name='dropout_2', dtype=dtype)(h)
+    h = layers.MaxPooling1D(pool_size=4, data_format='channels_last', name='max_pooling1d_2', dtype=dtype)(h)
     
     # Third Conv1D block
-    model.add(layers.Conv1D(256, 5, padding='same', name='conv1d_3'))
-    model.add(layers.Activation('relu', name='activation_3'))
-    model.add(layers.Dropout(0.1, name='dropout_3'))
+    h = layers.Conv1D(256, 5, padding='same', activation='relu', data_format='channels_last',
+                      name='conv1d_3', dtype=dtype)(h)
+    if include_dropout:
+        h = layers.Dropout(0.1, name='dropout_3', dtype=dtype)(h)
     
     # Flatten and dense layers
-    model.add(layers.Flatten(name='flatten_1'))
-    model.add(layers.Dense(8, name='dense_1'))
-    model.add(layers.Activation('softmax', name='activation_4'))
+    h = layers.Flatten(name='flatten_1', dtype=dtype)(h)
+    h = layers.Dense(8, name='dense_1', dtype=dtype)(h)
+    outputs = layers.Activation('softmax', name='activation_4', dtype='float32')(h)
+    
+    return models.Model(inputs, outputs, name="ser_cnn")
+
+def build_fallback_model() -> keras.Model:
+    """
+    Build the SER model architecture as a fallback when loading fails.
+    
+    Returns:
+        Compiled Keras model
+    """
+    model = _build_ser_cnn(include_dropout=True)
     
-    # Compile model
+    # Compile model; XLA fuses each conv, bias and ReLU into one kernel
     model.compile(
         optimizer='adam',
         loss='sparse_categorical_crossentropy',
-        metrics=['accuracy']
+        metrics=['accuracy'],
+        jit_compile=True
     )
     
     logger.info("Built fallback model architecture")
     return model
 
-def load_model_with_fallback(model_path: Optional[Path] = None) -> keras.Model:
+def build_inference_model(mixed_precision: bool = False) -> keras.Model:
     """
-    Load the SER model with fallback to rebuilding if loading fails.
+    Build the SER architecture without Dropout layers, for inference only.
+    
+    Dropout is the identity at inference time but still adds graph nodes;
+    layer names match build_fallback_model so weights transfer by name.
     
     Args:
-        model_path: Path to the model file (optional, uses config default)
+        mixed_precision: Compute in float16 with float32 weights and softmax
         
     Returns:
-        Loaded or rebuilt Keras model
+        Uncompiled Keras model
+    """
+    return _build_ser_cnn(include_dropout=False, mixed_precision=mixed_precision)
+
+@lru_cache(maxsize=None)
+def _gpu_available() -> bool:
+    """Whether TensorFlow can see a GPU, checked once per process."""
+    import tensorflow as tf
+    
+    return bool(tf.config.list_physical_devices("GPU"))
+
+def _strip_dropout(model: keras.Model, mixed_precision: bool = False) -> keras.Model:
+    """
+    Copy a model's weights into the Dropout-free inference architecture.
+    
+    Weights are matched by layer name and shape. Models without Dropout
+    are only rebuilt when mixed_precision is requested. Models that don't
+    follow the SER architecture are returned unchanged.
+    """
+    from tensorflow.keras import layers
+    
+    if not mixed_precision and not any(isinstance(layer, layers.Dropout) for layer in model.layers):
+        return model
+    
+    try:
+        lean = build_inference_model(mixed_precision=mixed_precision)
+        lean_weighted = [layer for layer in lean.layers if layer.weights]
+        if len(lean_weighted) != len([layer for layer in model.layers if layer.weights]):
+            return model
+        
+        for layer in lean_weighted:
+            weights = model.get_layer(layer.name).get_weights()
+            if [w.shape for w in weights] != [w.shape for w in layer.get_weights()]:
+                return model
+            layer.set_weights(weights)
+        
+        logger.info("Using Dropout-free mixed-precision inference graph" if mixed_precision
+                    else "Using Dropout-free inference graph")
+        return lean
+        
+    except ValueError:
+        # Layer names don't match the SER architecture
+        return model
+
+class TFLiteModel:
+    """
+    Run a converted SER model through the TFLite interpreter.
+    
+    Exposes the parts of the Keras model interface used by this package
+    (predict, input_shape, output_shape) so callers work unchanged. The
+    interpreter uses the XNNPACK CPU delegate, which avoids most of the
+    per-call overhead of keras.Model.predict for this small network.
+    
+    The interpreter is not thread-safe, so predict calls are serialized;
+    one instance can be shared across Streamlit sessions and threads.
+    """
+    
+    def __init__(self, model_content: bytes, num_threads: int = 2):
+        import tensorflow as tf
+        
+        self.model_content = model_content
+        self._interpreter = tf.lite.Interpreter(
+            model_content=model_content, num_threads=num_threads
+        )
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_keras(cls, model: keras.Model, num_threads: int = 2) -> "TFLiteModel":
+        """Convert a Keras model to TFLite and wrap it."""
+        import tensorflow as tf
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        
+        # The converter prints its export summary to stdout, which would
+        # end up in CLI reports and --json output
+        with contextlib.redirect_stdout(io.StringIO()):
+            model_content = converter.convert()
+        return cls(model_content, num_threads=num_threads)
+    
+    @classmethod
+    def from_file(cls, tflite_path: Path, num_threads: int = 2) -> "TFLiteModel":
+        """Load a .tflite flatbuffer from disk."""
+        return cls(tflite_path.read_bytes(), num_threads=num_threads)
+    
+    @property
+    def input_shape(self) -> tuple:
+        return (None,) + tuple(int(d) for d in self._input["shape"][1:])
+    
+    @property
+    def output_shape(self) -> tuple:
+        return (None,) + tuple(int(d) for d in self._output["shape"][1:])
+    
+    def predict(self, x: np.ndarray, verbose: int = 0) -> np.ndarray:
+        """Run inference on a batch, mirroring keras.Model.predict."""
+        x = np.asarray(x, dtype=np.float32)
+        
+        # Fully-quantized models take int8 input; map floats onto its scale
+        in_scale, in_zero = self._input["quantization"]
+        if self._input["dtype"] == np.int8:
+            x = np.clip(np.round(x / in_scale + in_zero), -128, 127).astype(np.int8)
+        
+        # Resize, set, invoke and read back as one step; another thread's
+        # resize in between would invalidate this call's tensors
+        with self._lock:
+            # Resize the interpreter when the batch size changes
+            if tuple(x.shape) != tuple(self._input["shape"]):
+                self._interpreter.resize_tensor_input(self._input["index"], x.shape)
+                self._interpreter.allocate_tensors()
+                self._input = self._interpreter.get_input_details()[0]
+                self._output = self._interpreter.get_output_details()[0]
+            
+            self._interpreter.set_tensor(self._input["index"], x)
+            self._interpreter.invoke()
+            y = self._interpreter.get_tensor(self._output["index"])
+            output = self._output
+        
+        # Dequantize int8 probabilities back to floats
+        if output["dtype"] == np.int8:
+            out_scale, out_zero = output["quantization"]
+            return (y.astype(np.float32) - out_zero) * out_scale
+        return y.copy()
+
+def convert_to_tflite_int8(model: keras.Model, rep_dataset: np.ndarray) -> bytes:
+    """
+    Convert a Keras model to a full-integer int8 TFLite flatbuffer.
+    
+    Weights and activations are quantized; int8 inputs and outputs are
+    quantized and dequantized by TFLiteModel.predict.
+    
+    Args:
+        model: Keras model to convert
+        rep_dataset: Calibration features, one (40,) MFCC vector per row,
+            used to estimate activation ranges
+        
+    Returns:
+        Serialized .tflite model
+    """
+    import tensorflow as tf
+    
+    calibration = np.asarray(rep_dataset, dtype=np.float32)
+    
+    def representative_dataset():
+        for features in calibration:
+            yield [adapt_input_shape(model, features)]
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    return converter.convert()
+
+class SavedModelRunner:
+    """
+    Run a frozen SavedModel through its serving signature.
+    
+    Loading a SavedModel restores the traced graph directly instead of
+    rebuilding Keras layers from an .h5 file. Exposes the same interface as
+    TFLiteModel (predict, input_shape, output_shape).
+    """
+    
+    def __init__(self, saved_model: Any):
+        signatures = getattr(saved_model, "signatures", {})
+        if "serving_default" not in signatures:
+            raise ValueError("SavedModel has no 'serving_default' signature")
+        
+        self._saved_model = saved_model
+        self._fn = signatures["serving_default"]
+        inputs = self._fn.structured_input_signature[1]
+        outputs = self._fn.structured_outputs
+        if len(inputs) != 1 or not isinstance(outputs, dict) or len(outputs) != 1:
+            raise ValueError("Expected a serving signature with one input and one output")
+        
+        # freeze_model names its output 'probs'; Keras exports use the
+        # final layer's name, so take whichever key the signature has
+        (self._input_name, spec), = inputs.items()
+        (self._output_name, out_spec), = outputs.items()
+        self._input_shape = tuple(spec.shape)
+        self._output_shape = tuple(out_spec.shape)
+    
+    @classmethod
+    def from_dir(cls, saved_model_dir: Path) -> "SavedModelRunner":
+        """Load a SavedModel directory with a single-input, single-output signature."""
+        import tensorflow as tf
+        
+        return cls(tf.saved_model.load(str(saved_model_dir)))
+    
+    @property
+    def input_shape(self) -> tuple:
+        return (None,) + self._input_shape[1:]
+    
+    @property
+    def output_shape(self) -> tuple:
+        return (None,) + self._output_shape[1:]
+    
+    def predict(self, x: np.ndarray, verbose: int = 0) -> np.ndarray:
+        """Run inference on a batch, mirroring keras.Model.predict."""
+        import tensorflow as tf
+        
+        outputs = self._fn(**{self._input_name: tf.constant(x, dtype=tf.float32)})
+        return outputs[self._output_name].numpy()
+
+def freeze_model(model: keras.Model, out_dir: Path) -> Path:
+    """
+    Save a Keras model as a SavedModel with a single inference signature.
+    
+    The Dropout-free inference graph is traced once against a
+    (None, *input_dims) float32 input and exported as 'serving_default',
+    returning the class probabilities under 'probs'.
+    
+    Args:
+        model: Keras model to freeze
+        out_dir: SavedModel directory to write
+        
+    Returns:
+        The SavedModel directory
+    """
+    import tensorflow as tf
+    
+    model = _strip_dropout(model)
+    inp_shape = model.input_shape
+    if isinstance(inp_shape, list):
+        inp_shape = inp_shape[0]
+    spec = tf.TensorSpec((None,) + tuple(inp_shape[1:]), dtype=tf.float32, name="features")
+    
+    serve = tf.function(
+        lambda features: {"probs": model(features, training=False)},
+        input_signature=[spec]
+    ).get_concrete_function()
+    
+    # Track the model on a plain module so only the graph and its
+    # variables are exported, not the Keras training config
+    module = tf.Module()
+    module.model = model
+    tf.saved_model.save(module, str(out_dir), signatures={"serving_default": serve})
+    return Path(out_dir)
+
+def _to_tflite(model: keras.Model) -> Any:
+    """Wrap a Keras model in a TFLite interpreter, keeping Keras on failure."""
+    try:
+        tflite_model = TFLiteModel.from_keras(model)
+        logger.info("Converted model to TFLite for inference")
+        return tflite_model
+    except Exception as e:
+        logger.warning(f"TFLite conversion failed, using Keras model: {e}")
+        return model
+
+def _compile_inference(model: keras.Model) -> keras.Model:
+    """
+    Attach an XLA-compiled forward pass to a Keras model as model._ser_infer.
+    
+    The forward pass is traced once against a (None, ...) input signature
+    built from the model's own input shape, and the resulting concrete
+    function is stored, so calls skip tf.function's dispatch and retracing
+    checks for any batch size. A batch of one is compiled here so the first
+    prediction doesn't pay for it. If XLA is unavailable the model is
+    returned unchanged and the eager call path is used.
+    """
+    import tensorflow as tf
+    
+    try:
+        inp_shape = model.input_shape
+        if isinstance(inp_shape, list):
+            inp_shape = inp_shape[0]
+        spec = tf.TensorSpec((None,) + tuple(inp_shape[1:]), dtype=tf.float32)
+        
+        infer = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[spec],
+            jit_compile=True
+        ).get_concrete_function()
+        infer(tf.zeros((1,) + tuple(inp_shape[1:]), dtype=tf.float32))
+        model._ser_infer = infer
+    except Exception as e:
+        logger.warning(f"XLA compilation unavailable, using eager inference: {e}")
+    
+    return model
+
+def _write_tflite_cache(tflite_model: TFLiteModel, tflite_path: Path) -> None:
+    """
+    Save a converted flatbuffer next to its source model for later loads.
+    
+    load_model_fast prefers a sibling .tflite that is newer than the model,
+    so conversion only happens the first time. Written to a temporary file
+    and renamed, so a concurrent load never reads a partial flatbuffer.
+    Failures (e.g. a read-only model directory) are logged and ignored.
+    """
+    tmp_path = tflite_path.with_name(f".{tflite_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(tflite_model.model_content)
+        os.replace(tmp_path, tflite_path)
+        logger.info(f"Cached converted TFLite model at {tflite_path}")
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Could not cache TFLite model at {tflite_path}: {e}")
+
+def _prepare_for_inference(
+    model: keras.Model,
+    use_tflite: bool,
+    tflite_cache: Optional[Path] = None,
+    mixed_precision: Optional[bool] = None
+) -> Any:
+    """
+    Convert to TFLite, or compile the Keras forward pass, for inference.
+    
+    A successful conversion is written to tflite_cache, when given, so the
+    next load reads the flatbuffer instead of converting again. Mixed
+    precision (mixed_precision set, or None on a GPU host) takes the Keras
+    path in float16 instead, since TFLite runs on the CPU in float32.
+    """
+    if mixed_precision is None:
+        mixed_precision = _gpu_available()
+    
+    lean = _strip_dropout(model)
+    converted = _to_tflite(lean) if use_tflite and not mixed_precision else lean
+    
+    if converted is not lean:
+        model = converted
+        if tflite_cache is not None:
+            _write_tflite_cache(model, tflite_cache)
+    else:
+        # Compile the Keras path when TFLite is off, skipped for mixed
+        # precision, or conversion failed
+        if mixed_precision:
+            lean = _strip_dropout(model, mixed_precision=True)
+        model = _compile_inference(lean)
+    
+    model._ser_prep = _make_input_adapter(model)
+    return model
+
+def load_model_fast(
+    model_path: Optional[Path] = None,
+    use_tflite: bool = True,
+    mixed_precision: Optional[bool] = None
+) -> keras.Model:
+    """
+    Load the SER model for inference, without the rebuild fallback.
+    
+    Args:
+        model_path: Path to the model file (optional, uses config default);
+            a .tflite path is loaded straight into a TFLiteModel and a
+            SavedModel directory into a SavedModelRunner
+        use_tflite: Convert the loaded model to a TFLite interpreter; the
+            converted flatbuffer is saved next to the model as .tflite and
+            reused on later loads
+        mixed_precision: Run the Keras model in float16 instead of TFLite
+            (default: only on GPUs); pass False for a float32 graph, e.g.
+            to use TFLite on a GPU host or when exporting
+        
+    Returns:
+        Loaded model (TFLiteModel when use_tflite is set and conversion
+        succeeds, otherwise the Keras model)
         
     Raises:
         FileNotFoundError: If model file doesn't exist
-        ValueError: If model cannot be loaded or rebuilt
+        ValueError: If model cannot be loaded
     """
     if model_path is None:
         model_path = get_model_path()
@@ -110,12 +562,101 @@ def load_model_with_fallback(model_path: Optional[Path] = None) -> keras.Model:
     if not model_path.exists():
         raise FileNotFoundError(f"Model file not found: {model_path}")
     
+    # A .tflite file given directly is run as-is
+    if model_path.suffix == ".tflite":
+        try:
+            logger.info(f"Loading TFLite model from {model_path}")
+            model = TFLiteModel.from_file(model_path)
+            model._ser_prep = _make_input_adapter(model)
+            return model
+        except Exception as e:
+            raise ValueError(f"Could not load TFLite model from {model_path}: {e}")
+    
+    # A SavedModel directory written by freeze_model skips Keras entirely;
+    # other SavedModels (e.g. saved by Keras) load through Keras below
+    if model_path.is_dir():
+        try:
+            logger.info(f"Loading SavedModel from {model_path}")
+            model = SavedModelRunner.from_dir(model_path)
+            model._ser_prep = _make_input_adapter(model)
+            return model
+        except Exception as e:
+            logger.info(f"No usable serving signature in {model_path}, loading with Keras: {e}")
+    
+    # Prefer a sibling .tflite (a cached conversion, or an int8 model built
+    # by scripts/quantize.py), unless the source model has changed since
+    # it was generated. SavedModel directories have no sibling of their own
+    # (SER_model/ and SER_model.h5 would share SER_model.tflite).
+    tflite_path = None if model_path.is_dir() else model_path.with_suffix(".tflite")
+    
+    # GPU hosts run the Keras graph in float16 rather than TFLite on the CPU
+    if mixed_precision is None:
+        mixed_precision = _gpu_available()
+    if mixed_precision:
+        use_tflite = False
+    
+    if (
+        use_tflite
+        and tflite_path is not None
+        and tflite_path.exists()
+        and tflite_path.stat().st_mtime >= model_path.stat().st_mtime
+    ):
+        try:
+            logger.info(f"Loading TFLite model from {tflite_path}")
+            model = TFLiteModel.from_file(tflite_path)
+            model._ser_prep = _make_input_adapter(model)
+            return model
+        except Exception as e:
+            logger.warning(f"Failed to load {tflite_path}, falling back to {model_path}: {e}")
+    
+    from tensorflow import keras
+    
     try:
-        # Try to load the model directly
         logger.info(f"Loading model from {model_path}")
         model = keras.models.load_model(model_path)
-        logger.info("Model loaded successfully")
-        return model
+    except Exception as e:
+        raise ValueError(f"Could not load model from {model_path}: {e}")
+    
+    logger.info("Model loaded successfully")
+    return _prepare_for_inference(model, use_tflite, tflite_path, mixed_precision)
+
+def load_model_with_fallback(
+    model_path: Optional[Path] = None,
+    use_tflite: bool = True,
+    mixed_precision: Optional[bool] = None
+) -> keras.Model:
+    """
+    Load the SER model with fallback to rebuilding if loading fails.
+    
+    Tries load_model_fast first; if a Keras model file can't be loaded
+    directly, the architecture is rebuilt and its weights loaded by name.
+    
+    Args:
+        model_path: Path to the model file (optional, uses config default);
+            a .tflite path is loaded straight into a TFLiteModel and a
+            SavedModel directory into a SavedModelRunner
+        use_tflite: Convert the loaded model to a TFLite interpreter
+        mixed_precision: Run the Keras model in float16 instead of TFLite
+            (default: only on GPUs); pass False for a float32 graph, e.g.
+            to use TFLite on a GPU host or when exporting
+        
+    Returns:
+        Loaded or rebuilt model (TFLiteModel when use_tflite is set and
+        conversion succeeds, otherwise the Keras model)
+        
+    Raises:
+        FileNotFoundError: If model file doesn't exist
+        ValueError: If model cannot be loaded or rebuilt
+    """
+    if model_path is None:
+        model_path = get_model_path()
+    
+    # Only Keras model files can be rebuilt from their weights
+    if not model_path.exists() or model_path.suffix == ".tflite" or model_path.is_dir():
+        return load_model_fast(model_path, use_tflite, mixed_precision)
+    
+    try:
+        return load_model_fast(model_path, use_tflite, mixed_precision)
         
     except Exception as e:
         logger.warning(f"Failed to load model directly: {e}")
@@ -128,7 +669,9 @@ def load_model_with_fallback(model_path: Optional[Path] = None) -> keras.Model:
             # Try to load weights by name
             model.load_weights(model_path, by_name=True)
             logger.info("Model rebuilt and weights loaded successfully")
-            return model
+            return _prepare_for_inference(
+                model, use_tflite, model_path.with_suffix(".tflite"), mixed_precision
+            )
             
         except Exception as e2:
             logger.error(f"Failed to rebuild model: {e2}")
@@ -137,13 +680,75 @@ def load_model_with_fallback(model_path: Optional[Path] = None) -> keras.Model:
                 f"Original error: {e}. Rebuild error: {e2}"
             )
 
-def predict_emotion(model: keras.Model, audio_path: Path) -> Dict[str, Any]:
+def _forward(model: keras.Model, x: np.ndarray) -> np.ndarray:
+    """
+    Run a single forward pass and return the output as a NumPy array.
+    
+    Keras models are called directly, which skips the data adapter and
+    iterator machinery keras.Model.predict sets up per call; other models
+    (TFLiteModel) go through their predict method.
+    """
+    if isinstance(model, TFLiteModel):
+        return model.predict(x, verbose=0)
+    
+    import tensorflow as tf
+    from tensorflow import keras
+    
+    if isinstance(model, keras.Model):
+        infer = getattr(model, "_ser_infer", None)
+        if infer is not None:
+            return infer(tf.constant(x, dtype=tf.float32)).numpy()
+        return model(tf.convert_to_tensor(x), training=False).numpy()
+    return model.predict(x, verbose=0)
+
+def _format_prediction(probs: np.ndarray, audio_path: AudioSource) -> Dict[str, Any]:
+    """Build the prediction result dictionary from one row of probabilities."""
+    probs = np.asarray(probs, dtype=np.float32)
+    
+    # Get top prediction
+    top_idx = int(probs.argmax())
+    top_prob = float(probs[top_idx])
+    
+    # Get emotion label
+    if 0 <= top_idx < len(EMOTIONS):
+        label = EMOTIONS[top_idx]
+    else:
+        label = f"unknown_{top_idx}"
+    
+    return {
+        "file": _source_name(audio_path),
+        "pred_index": top_idx,
+        "pred_label": label,
+        "confidence": round(top_prob, 4),
+        "probs": probs.tolist()
+    }
+
+def predict_features(model: keras.Model, features: np.ndarray, audio_path: AudioSource) -> Dict[str, Any]:
+    """
+    Predict emotion from pre-extracted MFCC features.
+    
+    Args:
+        model: Loaded Keras model
+        features: MFCC features as returned by extract_features
+        audio_path: Audio file (or buffer) the features came from
+        
+    Returns:
+        Dictionary with prediction results
+    """
+    # Adapt input shape
+    x = _prepare_input(model, features)
+    
+    # Make prediction
+    predictions = _forward(model, x)
+    return _format_prediction(predictions[0], audio_path)
+
+def predict_emotion(model: keras.Model, audio_path: AudioSource) -> Dict[str, Any]:
     """
     Predict emotion from an audio file.
     
     Args:
         model: Loaded Keras model
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or a binary buffer holding one
         
     Returns:
         Dictionary with prediction results
@@ -152,54 +757,142 @@ def predict_emotion(model: keras.Model, audio_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If audio file doesn't exist
         ValueError: If prediction fails
     """
-    if not audio_path.exists():
+    if isinstance(audio_path, Path) and not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
     
     try:
         # Extract features
         features = extract_features(audio_path)
         
-        # Adapt input shape
-        x = adapt_input_shape(model, features)
+        return predict_features(model, features, audio_path)
         
-        # Make prediction
-        predictions = model.predict(x, verbose=0)
-        probs = predictions[0]
-        
-        # Get top prediction
-        top_idx = int(np.argmax(probs))
-        top_prob = float(probs[top_idx])
+    except Exception as e:
+        name = _source_name(audio_path)
+        logger.error(f"Error predicting emotion for {name}: {e}")
+        raise ValueError(f"Prediction failed for {name}: {e}")
+
+def predict_emotion_batch(
+    model: keras.Model,
+    audio_paths: List[Path],
+    features: Optional[np.ndarray] = None,
+    batch_size: int = 32
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Predict emotions for several audio files in batched forward passes.
+    
+    Features are stacked into one (N, 40, 1) array, adapted to the model's
+    input shape once, and run through the model batch_size rows at a time,
+    amortizing per-call overhead. Results stay in NumPy arrays; use
+    predict_paths for per-file result dictionaries.
+    
+    Args:
+        model: Loaded Keras model
+        audio_paths: Paths to audio files
+        features: Pre-extracted (N, 40) features for audio_paths (optional);
+            extracted on a thread pool when omitted
+        batch_size: Rows per forward pass
         
-        # Get emotion label
-        if 0 <= top_idx < len(EMOTIONS):
-            label = EMOTIONS[top_idx]
-        else:
-            label = f"unknown_{top_idx}"
+    Returns:
+        Tuple of (labels, confidences, probs) in input order: predicted
+        labels, (N,) float32 top-class probabilities and the (N, C)
+        float32 probability matrix
         
-        return {
-            "file": str(audio_path),
-            "pred_index": top_idx,
+    Raises:
+        FileNotFoundError: If an audio file doesn't exist
+        ValueError: If feature extraction fails for a file
+    """
+    if not audio_paths:
+        return [], np.empty(0, dtype=np.float32), np.empty((0, len(EMOTIONS)), dtype=np.float32)
+    
+    if features is None:
+        # Decoding, the FFT and the numba mel kernel all release the GIL
+        with ThreadPoolExecutor() as executor:
+            features = np.stack(list(executor.map(extract_features, audio_paths)))
+    
+    x = _prepare_input(model, features)
+    probs = np.concatenate([
+        _forward(model, x[start:start + batch_size])
+        for start in range(0, len(x), batch_size)
+    ]).astype(np.float32, copy=False)
+    
+    # Top class, its probability and its label for every row at once
+    top_idx = probs.argmax(axis=1).astype(np.int32)
+    confidences = probs[np.arange(len(probs)), top_idx]
+    labels = _EMOTION_LABELS[np.minimum(top_idx, len(EMOTIONS) - 1)]
+    
+    # Models with more outputs than EMOTIONS get placeholder labels
+    unknown = top_idx >= len(EMOTIONS)
+    if unknown.any():
+        labels[unknown] = [f"unknown_{idx}" for idx in top_idx[unknown]]
+    
+    return labels.tolist(), confidences, probs
+
+def predict_paths(model: keras.Model, audio_paths: List[Path]) -> List[Dict[str, Any]]:
+    """
+    Predict emotions for several audio files with batched forward passes.
+    
+    Kept for backward compatibility; see predict_emotion_batch.
+    """
+    labels, confidences, probs = predict_emotion_batch(model, audio_paths)
+    top_idx = probs.argmax(axis=1)
+    
+    return [
+        {
+            "file": _source_name(audio_path),
+            "pred_index": int(idx),
             "pred_label": label,
-            "confidence": round(top_prob, 4),
-            "probs": probs.tolist()
+            "confidence": round(float(conf), 4),
+            "probs": row.tolist()
         }
+        for audio_path, idx, label, conf, row in zip(audio_paths, top_idx, labels, confidences, probs)
+    ]
+
+@lru_cache(maxsize=4)
+def _load_cached(resolved_path: str, safe_load: bool) -> keras.Model:
+    """Load a model once per resolved path; see get_cached_model."""
+    if safe_load:
+        return load_model_with_fallback(Path(resolved_path))
+    return load_model_fast(Path(resolved_path))
+
+def get_cached_model(model_path: Optional[Path] = None, safe_load: bool = False) -> keras.Model:
+    """
+    Load the SER model once per path and reuse it on later calls.
+    
+    Args:
+        model_path: Path to the model file (optional, uses config default)
+        safe_load: Rebuild the model from its weights if it can't be
+            loaded directly (see load_model_with_fallback)
         
-    except Exception as e:
-        logger.error(f"Error predicting emotion for {audio_path}: {e}")
-        raise ValueError(f"Prediction failed for {audio_path}: {e}")
+    Returns:
+        The loaded model, shared by every caller asking for the same path
+    """
+    if model_path is None:
+        model_path = get_model_path()
+    # Normalize without following symlinks, so a sibling .tflite is still
+    # looked up next to the path the caller gave
+    return _load_cached(os.path.abspath(model_path), safe_load)
 
-def predict_path(audio_path: Path, model_path: Optional[Path] = None) -> Dict[str, Any]:
+def predict_path(
+    audio_path: AudioSource,
+    model_path: Optional[Path] = None,
+    safe_load: bool = False
+) -> Dict[str, Any]:
     """
     Convenience function to load model and predict emotion.
     
+    The model is loaded on first use and cached by its resolved path, so
+    repeated calls only pay for feature extraction and the forward pass.
+    
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or a binary buffer holding one
         model_path: Path to model file (optional)
+        safe_load: Rebuild the model from its weights if it can't be
+            loaded directly (see load_model_with_fallback)
         
     Returns:
         Dictionary with prediction results
     """
-    model = load_model_with_fallback(model_path)
+    model = get_cached_model(model_path, safe_load)
     return predict_emotion(model, audio_path)
 
 # Backward compatibility